@@ -2,25 +2,28 @@ import discord
 from discord import Embed, app_commands, Interaction, ui, ButtonStyle
 from discord.ext import commands, tasks
 import asyncio
-import requests
+import functools
+import hashlib
+import operator
 import os
-import math
 import random
-from collections import defaultdict, deque
+from collections import deque
 from dotenv import load_dotenv
 import certifi
-from pymongo import MongoClient, ASCENDING
-from pymongo.server_api import ServerApi
-from datetime import datetime, timedelta
-import pytz
+from pymongo import ASCENDING, UpdateOne
+from motor.motor_asyncio import AsyncIOMotorClient
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from langdetect import detect, LangDetectException
+from cachetools import TTLCache, LRUCache
 from enum import Enum
 import aiohttp
+import yarl
 import json
+import orjson
 from dateutil.parser import isoparse
 import re
-from flask import Flask
-import threading
+from aiohttp import web
 import time
 import pyktok as pyk
 from instaloader import Instaloader, Post, TwoFactorAuthRequiredException
@@ -28,7 +31,7 @@ import tempfile
 from urllib.parse import urlencode, urlparse, parse_qs
 
 # Set timezone to Philippines (GMT+8)
-PH_TIMEZONE = pytz.timezone("Asia/Manila")
+PH_TIMEZONE = ZoneInfo("Asia/Manila")
 load_dotenv()
 
 # ===========================
@@ -39,34 +42,84 @@ intents.message_content = True
 intents.members = True 
 bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
 
-# Rate limiting data
-bot.ask_rate_limit = defaultdict(list)
-bot.conversations = defaultdict(list)  # In-memory cache for AI conversation
-bot.last_message_id = {}  # Store last message IDs for threaded replies
+# Shared HTTP session (created once in setup_hook, reused by every command)
+bot.http_session = None
+bot._ask_worker = None
+
+async def setup_hook():
+    bot.http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(total=60),
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        # No cookie jar on the shared session: the /check login flow would
+        # otherwise park a user's .ROBLOSECURITY Set-Cookie here and replay
+        # it on every later roblox.com request from unrelated commands.
+        # Every caller that needs cookies passes them explicitly.
+        cookie_jar=aiohttp.DummyCookieJar()
+    )
+    await start_web_server()
+    await create_mongo_indexes()
+    if conversations_collection is not None:
+        flush_conversations.start()
+    update_presence.start()
+    bot._ask_worker = asyncio.create_task(_ask_batch_worker())
+    # Sync the command tree once per process. on_ready fires on every gateway
+    # reconnect, so syncing there re-uploaded the full tree each time and ate
+    # into Discord's aggressive sync rate limit.
+    await bot.tree.sync()
+    print("All commands synced!")
+
+bot.setup_hook = setup_hook
+
+_original_close = bot.close
+async def _close():
+    if bot._ask_worker is not None:
+        bot._ask_worker.cancel()
+    if update_presence.is_running():
+        update_presence.cancel()
+    if flush_conversations.is_running():
+        flush_conversations.cancel()
+    if bot._conv_buffer and conversations_collection is not None:
+        try:
+            await conversations_collection.bulk_write(
+                [_turn_update(user_id, turn) for user_id, turn in bot._conv_buffer], ordered=False
+            )
+        except Exception as e:
+            print(f"[!] Failed to flush conversation buffer on shutdown: {e}")
+        bot._conv_buffer.clear()
+    if bot.http_session is not None:
+        await bot.http_session.close()
+    await _original_close()
+bot.close = _close
+
+# Rate limiting data. TTL eviction drops users idle for two minutes, so the
+# map stays bounded instead of growing with every user who ever ran /ask.
+bot.ask_rate_limit = TTLCache(maxsize=10000, ttl=120)
+
+class _ConversationCache(LRUCache):
+    # Evicted users must also lose their "history already loaded" mark so a
+    # later /ask reloads their turns from Mongo.
+    def popitem(self):
+        key, value = super().popitem()
+        bot.history_loaded.discard(key)
+        return key, value
+
+bot.conversations = _ConversationCache(maxsize=5000)  # In-memory cache for AI conversation, cold users evicted
+bot.history_loaded = set()  # user_ids whose Mongo history is in bot.conversations
+bot.last_message_id = LRUCache(maxsize=10000)  # Store last message IDs for threaded replies
 
 # ===========================
-# Flask Web Server to Keep Bot Alive
+# Keep-Alive Web Server (aiohttp, runs on the bot's event loop)
 # ===========================
-app = Flask(__name__)
-@app.route('/')
-def home():
-    return "Bot is alive!"
-
-def run_server():
-    app.run(host='0.0.0.0', port=5000)
+async def _home(request):
+    return web.Response(text="Bot is alive!")
 
-server_thread = threading.Thread(target=run_server)
-server_thread.start()
-
-# Optional: Add another threaded task
-def check_for_updates():
-    while True:
-        print("[Background] Checking for updates...")
-        time.sleep(300)  # Every 5 minutes
-
-update_thread = threading.Thread(target=check_for_updates)
-update_thread.daemon = True
-update_thread.start()
+async def start_web_server():
+    webapp = web.Application()
+    webapp.router.add_get("/", _home)
+    runner = web.AppRunner(webapp)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", 5000).start()
 
 # ===========================
 # MongoDB Setup (with SSL Fix)
@@ -82,7 +135,9 @@ if not mongo_uri:
     print("[!] MONGO_URI not found in environment. MongoDB will be disabled.")
 else:
     try:
-        client = MongoClient(mongo_uri, tlsCAFile=certifi.where())
+        # w=1 without journal acknowledgement: a lost reminder or cached AI
+        # turn on a crash is acceptable, waiting on the disk journal is not.
+        client = AsyncIOMotorClient(mongo_uri, tlsCAFile=certifi.where(), w=1, journal=False)
         db = client.ai_bot
 
         # Initialize collections
@@ -90,13 +145,6 @@ else:
         reminders_collection = db.reminders
         rates_collection = db.rates  # ← New collection for rates
 
-        # Create TTL indexes
-        conversations_collection.create_index("timestamp", expireAfterSeconds=604800)  # 7 days
-        reminders_collection.create_index("reminder_time", expireAfterSeconds=2592000)  # 30 days
-
-        # Create index for guild_id in rates collection
-        rates_collection.create_index([("guild_id", ASCENDING)], unique=True)
-
         print("✅ Successfully connected to MongoDB")
     except Exception as e:
         print(f"[!] Failed to connect to MongoDB: {e}")
@@ -105,6 +153,81 @@ else:
         reminders_collection = None
         rates_collection = None
 
+# Buffered conversation writes: collapse one insert per /ask into one
+# insert_many every couple of seconds.
+bot._conv_buffer = []
+
+@tasks.loop(seconds=2)
+async def flush_conversations():
+    if not bot._conv_buffer or conversations_collection is None:
+        return
+    batch = bot._conv_buffer[:]
+    bot._conv_buffer.clear()
+    try:
+        await conversations_collection.bulk_write(
+            [_turn_update(user_id, turn) for user_id, turn in batch], ordered=False
+        )
+    except Exception as e:
+        print(f"[!] Failed to flush conversation buffer: {e}")
+
+def _turn_update(user_id, turn):
+    # One document per user with the last five turns in a capped array: the
+    # read becomes a point lookup and the write needs no sort or TTL rotation.
+    return UpdateOne(
+        {"_id": user_id},
+        {"$push": {"turns": {"$each": [turn], "$slice": -5}}},
+        upsert=True
+    )
+
+async def create_mongo_indexes():
+    if client is None:
+        return
+    try:
+        # Conversations are one capped-array document per user keyed by _id,
+        # so they rotate via $slice and need no TTL or secondary index.
+        await reminders_collection.create_index("reminder_time", expireAfterSeconds=2592000)  # 30 days
+
+        # Create index for guild_id in rates collection
+        await rates_collection.create_index([("guild_id", ASCENDING)], unique=True)
+
+        # Guardrail: Mongo only honors expireAfterSeconds on single-field
+        # indexes. A compound TTL key added later would never expire anything
+        # while the TTL monitor keeps rescanning it, so fail loudly here.
+        for collection in (conversations_collection, reminders_collection, rates_collection):
+            async for idx in collection.list_indexes():
+                if "expireAfterSeconds" in idx and len(idx["key"]) != 1:
+                    msg = f"TTL index {idx['name']} on {collection.name} must have exactly one key"
+                    print(f"[!] {msg}")
+                    raise RuntimeError(msg)
+    except RuntimeError:
+        # The guardrail must abort startup, not degrade to a log line
+        raise
+    except Exception as e:
+        print(f"[!] Failed to create MongoDB indexes: {e}")
+
+async def _finish_poll(channel, message_id: int, question: str):
+    # The gateway keeps reaction counts current for cached messages, so a
+    # short poll that is still in the cache needs no REST fetch at all.
+    message = bot._connection._get_message(message_id)
+    if message is None:
+        message = await channel.fetch_message(message_id)
+    counts = {str(r.emoji): r.count for r in message.reactions}
+    up_count = counts.get("👍", 0)
+    down_count = counts.get("👎", 0)
+    if up_count > down_count:
+        result = "👍 Upvotes win!"
+    elif down_count > up_count:
+        result = "👎 Downvotes win!"
+    else:
+        result = "⚖️ It's a tie!"
+    result_embed = discord.Embed(title="📊 Poll Results", description=question, color=discord.Color.green())
+    result_embed.add_field(name="👍 Upvotes", value=str(up_count), inline=True)
+    result_embed.add_field(name="👎 Downvotes", value=str(down_count), inline=True)
+    result_embed.add_field(name="Result", value=result, inline=False)
+    result_embed.set_footer(text="Poll has ended")
+    result_embed.timestamp = discord.utils.utcnow()
+    await message.edit(embed=result_embed)
+
 # Background Task: Check Reminders
 @tasks.loop(seconds=60)
 async def check_reminders():
@@ -112,32 +235,144 @@ async def check_reminders():
         return
     try:
         now = datetime.now(PH_TIMEZONE)
-        expired = reminders_collection.find({"reminder_time": {"$lte": now}})
+        expired = await reminders_collection.find(
+            {"reminder_time": {"$lte": now}},
+            {"type": 1, "timer": 1, "user_id": 1, "guild_id": 1, "channel_id": 1, "note": 1, "message_id": 1, "question": 1}
+        ).sort("reminder_time", 1).limit(100).to_list(length=100)
+        if not expired:
+            return
+
+        # Deliver concurrently; each delivery returns the _ids to delete, or
+        # an empty list to leave the documents for a later tick / TTL expiry.
+        async def _deliver_poll(reminder):
+            # Same policy as plain reminders: an unresolved channel (cold
+            # cache after a reconnect) leaves the doc for a later tick.
+            channel = bot.get_channel(reminder["channel_id"])
+            if channel is None:
+                return []
+            try:
+                await _finish_poll(channel, reminder["message_id"], reminder["question"])
+            except (discord.NotFound, discord.Forbidden) as e:
+                # Deleted poll message or lost access: retrying every tick
+                # for the TTL window won't help, so drop the doc anyway.
+                print(f"[!] Cannot finish poll {reminder['message_id']}: {e}")
+            return [reminder["_id"]]
+
+        # Plain reminders are grouped per channel so each channel is resolved
+        # once and gets one combined message, however many fire this tick.
+        # Mentions are built from the stored IDs, so no user lookups either.
+        # Reminders flagged "timer" may race the in-process timer, so they
+        # are claimed individually instead of joining the grouped path.
+        by_channel = {}
+        timer_backed = []
+        polls = []
         for reminder in expired:
-            user_id = reminder["user_id"]
-            guild_id = reminder["guild_id"]
-            channel_id = reminder["channel_id"]
-            note = reminder["note"]
-            user = bot.get_user(user_id)
-            if not user:
-                user = await bot.fetch_user(user_id)
-            guild = bot.get_guild(guild_id)
+            if reminder.get("type") == "poll":
+                polls.append(reminder)
+            elif reminder.get("timer"):
+                timer_backed.append(reminder)
+            else:
+                key = (reminder["guild_id"], reminder["channel_id"])
+                by_channel.setdefault(key, []).append(reminder)
+
+        async def _deliver_claimed(reminder):
+            # Delete-first on both racers: whichever of this sweep and the
+            # in-process timer wins the delete sends the ping, so a timer
+            # firing mid-sweep can't produce a duplicate.
+            result = await reminders_collection.delete_one({"_id": reminder["_id"]})
+            if not result.deleted_count:
+                return []
+            guild = bot.get_guild(reminder["guild_id"])
+            channel = guild.get_channel(reminder["channel_id"]) if guild else None
+            if channel is not None:
+                try:
+                    await channel.send(f"🔔 <@{reminder['user_id']}>, reminder: {reminder['note']}")
+                except discord.Forbidden:
+                    print("[!] Cannot send reminder (missing permissions)")
+            return []
+
+        async def _deliver_channel(key, reminders):
+            guild = bot.get_guild(key[0])
             if not guild:
-                continue
-            channel = guild.get_channel(channel_id)
+                return []
+            channel = guild.get_channel(key[1])
             if not channel:
-                continue
+                return []
+            # Notes are slash-command strings, so a couple of reminders can
+            # overflow Discord's 2000-char limit; pack lines into as few
+            # sends as fit (truncating any single oversized line).
+            chunks = []
+            current = ""
+            for r in reminders:
+                line = f"🔔 <@{r['user_id']}>, reminder: {r['note']}"[:2000]
+                if current and len(current) + 1 + len(line) > 2000:
+                    chunks.append(current)
+                    current = line
+                else:
+                    current = f"{current}\n{line}" if current else line
+            chunks.append(current)
             try:
-                await channel.send(f"🔔 {user.mention}, reminder: {note}")
-            except discord.Forbidden:
-                print(f"[!] Cannot send reminder to {user} in #{channel.name}")
-            # Delete reminder after sending
-            reminders_collection.delete_one({"_id": reminder["_id"]})
+                for chunk in chunks:
+                    await channel.send(chunk)
+            except discord.HTTPException as e:
+                # Forbidden or otherwise, retrying next sweep won't change
+                # the outcome; drop the docs instead of failing for 30 days.
+                print(f"[!] Cannot send reminders: {e}")
+            return [r["_id"] for r in reminders]
+
+        results = await asyncio.gather(
+            *map(_deliver_poll, polls),
+            *map(_deliver_claimed, timer_backed),
+            *(_deliver_channel(key, reminders) for key, reminders in by_channel.items()),
+            return_exceptions=True,
+        )
+        done_ids = [
+            _id for ids in results if not isinstance(ids, BaseException) for _id in ids
+        ]
+
+        # Delete all fired reminders in a single round trip
+        if done_ids:
+            await reminders_collection.delete_many({"_id": {"$in": done_ids}})
     except Exception as e:
         print(f"[!] Error checking reminders: {e}")
 
+# Background Task: Presence Refresh
+# Replaces the old while-True loop in on_ready, which spawned a duplicate
+# loop on every reconnect and hammered Roblox at fixed cadence during
+# outages. On failure the interval backs off 60 -> 120 -> ... -> 900s and
+# snaps back to 60s on the next success.
+@tasks.loop(seconds=60)
+async def update_presence():
+    group_id = int(os.getenv("GROUP_ID"))
+    try:
+        data = await cached_get(("group", group_id), _GROUPS_API_URL / str(group_id), ttl=_GROUP_TTL)
+        member_count = data['memberCount']
+        # Skip the gateway call when the count hasn't moved since last tick
+        if member_count != update_presence.last_count:
+            await bot.change_presence(status=discord.Status.dnd,
+                                   activity=discord.Activity(
+                                       type=discord.ActivityType.watching,
+                                       name=f"1cy | {member_count} Members"))
+            update_presence.last_count = member_count
+        if update_presence.seconds != 60:
+            update_presence.change_interval(seconds=60)
+    except Exception as e:
+        print(f"Error fetching group info: {str(e)}")
+        await bot.change_presence(status=discord.Status.dnd,
+                               activity=discord.Activity(
+                                   type=discord.ActivityType.watching,
+                                   name="1cy"))
+        update_presence.last_count = None
+        update_presence.change_interval(seconds=min(900, update_presence.seconds * 2))
+
+update_presence.last_count = None
+
+@update_presence.before_loop
+async def _presence_wait_ready():
+    await bot.wait_until_ready()
+
 # Rates DB
-def get_current_rates(guild_id: str):
+async def get_current_rates(guild_id: str):
     # Check if MongoDB is disabled
     if rates_collection is None:
         return {
@@ -148,7 +383,7 @@ def get_current_rates(guild_id: str):
         }
 
     guild_id = str(guild_id)
-    result = rates_collection.find_one({"guild_id": guild_id})
+    result = await rates_collection.find_one({"guild_id": guild_id})
 
     return {
         "payout": result.get("payout_rate", 330.0) if result else 330.0,
@@ -207,21 +442,27 @@ async def dmall(interaction: discord.Interaction, message: str):
             await interaction.followup.send(f"❌ Failed to fetch members: {e}", ephemeral=True)
             return
 
-    success_count = 0
-    fail_count = 0
+    # DM members concurrently, capped so discord.py's rate limiter isn't flooded
+    sem = asyncio.Semaphore(10)
+
+    async def send_one(member):
+        async with sem:
+            try:
+                await member.send(message)
+                return True
+            except discord.Forbidden:
+                return False
+            except Exception as e:
+                print(f"[!] Failed to send DM to {member} ({member.id}): {str(e)}")
+                return False
 
-    for member in guild.members:
-        if member.bot:
-            continue  # Skip bots
+    # Materialize the target list once (deduped by member id) before sending
+    targets = list({m.id: m for m in guild.members if not m.bot}.values())
+    await interaction.followup.send(f"📨 Sending DM to **{len(targets)}** members...", ephemeral=True)
 
-        try:
-            await member.send(message)
-            success_count += 1
-        except discord.Forbidden:
-            fail_count += 1
-        except Exception as e:
-            print(f"[!] Failed to send DM to {member} ({member.id}): {str(e)}")
-            fail_count += 1
+    results = await asyncio.gather(*(send_one(m) for m in targets))
+    success_count = sum(results)
+    fail_count = len(results) - success_count
 
     await interaction.followup.send(
         f"✅ Successfully sent DM to **{success_count}** members. "
@@ -232,6 +473,136 @@ async def dmall(interaction: discord.Interaction, message: str):
 # AI Commands
 # ===========================
 
+LANG_INSTRUCTIONS = {
+    "tl": "Please respond in Tagalog.",
+    "es": "Por favor responde en español.",
+    "fr": "Veuillez répondre en français.",
+    "ja": "日本語で答えてください。",
+    "ko": "한국어로 답변해 주세요。",
+    "zh": "请用中文回答。",
+    "ru": "Пожалуйста, отвечайте на русском языке。",
+    "ar": "من فضلك أجب بالعربية。",
+    "vi": "Vui lòng trả lời bằng tiếng Việt.",
+    "th": "กรุณาตอบเป็นภาษาไทย",
+    "id": "Silakan jawab dalam bahasa Indonesia"
+}
+
+TOGETHER_HEADERS = {
+    "Authorization": f"Bearer {os.getenv('TOGETHER_API_KEY')}",
+    "Content-Type": "application/json"
+}
+
+CREATOR_TRIGGERS = frozenset({
+    "who made you", "who created you", "who created this bot", "who made this bot"
+})
+
+_CREATOR_EMBED_TEMPLATE = discord.Embed(description="I was created by **Neroniel**.", color=discord.Color.from_rgb(0, 0, 0))
+_CREATOR_EMBED_TEMPLATE.set_footer(text="Neroniel AI")
+
+# Dedupe identical Together AI calls for an hour
+_resp_cache = TTLCache(maxsize=2048, ttl=3600)
+
+class CircuitBreaker:
+    """Short-circuit an upstream after repeated consecutive failures.
+
+    While open, callers skip the request (and its full timeout) entirely;
+    after the cooldown the next call is let through as a probe, and one
+    success closes the breaker again.
+    """
+    def __init__(self, threshold=5, cooldown=30):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+
+    def is_open(self):
+        if self._opened_at is None:
+            return False
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            # Half-open: allow a single probe; one more failure reopens
+            self._opened_at = None
+            self._failures = self.threshold - 1
+            return False
+        return True
+
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._opened_at = time.monotonic()
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+
+_together_breaker = CircuitBreaker()
+
+# Keep strong references to fire-and-forget DB tasks until they finish
+_bg_tasks = set()
+
+def _spawn_bg(coro):
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+
+@functools.lru_cache(maxsize=4096)
+def _detect_language(text: str) -> str:
+    try:
+        return detect(text)
+    except LangDetectException:
+        return "en"  # Default to English
+
+# Asynchronous batching for /ask: turns that arrive within a 50ms window are
+# sent to Together as one list-prompt completion call and demuxed back onto
+# their futures. A turn that ends up alone in the window gets None back and
+# falls through to the lower-latency streaming path. The bounded queue applies
+# backpressure under heavy load.
+_ask_queue = asyncio.Queue(maxsize=64)
+
+async def _ask_batch_worker():
+    while True:
+        batch = [await _ask_queue.get()]
+        await asyncio.sleep(0.05)
+        while len(batch) < 16:
+            try:
+                batch.append(_ask_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if len(batch) == 1:
+            fut = batch[0][1]
+            if not fut.done():
+                fut.set_result(None)
+            continue
+        payload = {
+            "model": "meta-llama/Llama-3-70b-chat-hf",
+            "prompt": [flat_prompt for flat_prompt, _ in batch],
+            "max_tokens": 2048,
+            "temperature": 0.7,
+            "stop": ["User:"]
+        }
+        try:
+            async with bot.http_session.post(
+                "https://api.together.xyz/v1/completions",
+                headers=TOGETHER_HEADERS,
+                json=payload
+            ) as response:
+                data = await response.json()
+            choices = data["choices"]
+            _together_breaker.record_success()
+            for i, (_, fut) in enumerate(batch):
+                if fut.done():
+                    continue
+                try:
+                    fut.set_result(choices[i]["text"].strip())
+                except (IndexError, KeyError) as e:
+                    fut.set_exception(RuntimeError(f"batched completion missing choice: {e}"))
+        except Exception as e:
+            # Under load nearly all traffic takes this path, so the breaker
+            # has to see these failures too or it never opens in an outage.
+            _together_breaker.record_failure()
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+
 @bot.tree.command(name="ask", description="Chat with an AI assistant using Llama 3")
 @app_commands.describe(prompt="What would you like to ask?")
 async def ask(interaction: discord.Interaction, prompt: str):
@@ -241,156 +612,232 @@ async def ask(interaction: discord.Interaction, prompt: str):
     # Defer response immediately
     await interaction.response.defer()
 
-    # Rate limiting: 5 requests per minute
-    current_time = asyncio.get_event_loop().time()
-    timestamps = bot.ask_rate_limit[user_id]
-
-    # Clean up old timestamps before appending new one
-    bot.ask_rate_limit[user_id] = [t for t in timestamps if current_time - t <= 60]
-    bot.ask_rate_limit[user_id].append(current_time)
+    # Creator-question short-circuit: answer before any detection or history work
+    normalized_prompt = prompt.strip().lower()
+    if normalized_prompt in CREATOR_TRIGGERS:
+        embed = _CREATOR_EMBED_TEMPLATE.copy()
+        embed.timestamp = datetime.now(PH_TIMEZONE)
+        msg = await interaction.followup.send(embed=embed)
+        bot.last_message_id[(user_id, channel_id)] = msg.id
+        return
 
-    if len(bot.ask_rate_limit[user_id]) > 5:
+    # Rate limiting: 5 requests per minute
+    current_time = time.monotonic()
+    timestamps = bot.ask_rate_limit.get(user_id)
+    if timestamps is None:
+        # maxlen hard-bounds per-user memory even under a request flood: the
+        # limit check only ever needs the six most recent timestamps.
+        timestamps = deque(maxlen=6)
+    bot.ask_rate_limit[user_id] = timestamps  # refresh the TTL on activity
+
+    # Drop timestamps that fell out of the window; amortized O(1) per call
+    while timestamps and current_time - timestamps[0] > 60:
+        timestamps.popleft()
+    timestamps.append(current_time)
+
+    if len(timestamps) > 5:
         await interaction.followup.send("⏳ You're being rate-limited. Please wait a minute.")
         return
 
-    async with interaction.channel.typing():
-        try:
-            # Custom filter for creator questions
-            normalized_prompt = prompt.strip().lower()
-            if normalized_prompt in ["who made you", "who created you", "who created this bot", "who made this bot"]:
-                embed = discord.Embed(description="I was created by **Neroniel**.", color=discord.Color.from_rgb(0, 0, 0))
-                embed.set_footer(text="Neroniel AI")
-                embed.timestamp = datetime.now(PH_TIMEZONE)
-                msg = await interaction.followup.send(embed=embed)
-                bot.last_message_id[(user_id, channel_id)] = msg.id
-                return
+    try:
+        # Language Detection (cached, and run off the event loop)
+        # Normalized key so trivial variants ("Hi", "hi ") share one entry
+        detected_lang = await asyncio.to_thread(_detect_language, normalized_prompt[:128])
+
+        lang_instruction = LANG_INSTRUCTIONS.get(detected_lang, "")
+
+        # Load conversation history from MongoDB (if available)
+        history = []
+        if conversations_collection is not None:
+            user_history = bot.conversations.setdefault(user_id, [])
+            if user_id not in bot.history_loaded:
+                doc = await conversations_collection.find_one(
+                    {"_id": user_id}, {"turns": 1}
+                )
+                if doc:
+                    user_history.extend(
+                        {"user": turn["u"], "assistant": turn["a"]}
+                        for turn in doc.get("turns", [])
+                    )
+                bot.history_loaded.add(user_id)
+            history = user_history[-5:]
+
+        # Build the chat messages with language instruction
+        system_prompt = f"You are a helpful and friendly AI assistant named Neroniel AI. {lang_instruction}"
+        messages = [{"role": "system", "content": system_prompt}]
+        for msg in history:
+            messages.append({"role": "user", "content": msg["user"]})
+            messages.append({"role": "assistant", "content": msg["assistant"]})
+        messages.append({"role": "user", "content": prompt})
+
+        # Flat transcript for the batched list-prompt path
+        flat_parts = [system_prompt]
+        flat_parts.extend(f"User: {m['user']}\nAssistant: {m['assistant']}" for m in history)
+        flat_parts.append(f"User: {prompt}\nAssistant:")
+        flat_prompt = "\n".join(flat_parts)
+
+        # Stream from Together AI so users see output as it is generated
+        payload = {
+            "model": "meta-llama/Llama-3-70b-chat-hf",
+            "messages": messages,
+            "max_tokens": 2048,
+            "temperature": 0.7,
+            "stream": True
+        }
+
+        # Determine if we should reply to a previous message
+        target_message_id = bot.last_message_id.get((user_id, channel_id))
+
+        def _build_embed(text):
+            embed = discord.Embed(description=text, color=discord.Color.from_rgb(0, 0, 0))
+            embed.set_footer(text="Neroniel AI")
+            embed.timestamp = datetime.now(PH_TIMEZONE)
+            return embed
+
+        async def _send_or_reply(embed):
+            if target_message_id:
+                # Reply by ID: no fetch_message round trip, and
+                # fail_if_not_exists=False degrades to a plain send if the
+                # earlier message was deleted instead of raising a 404.
+                ref = discord.MessageReference(
+                    message_id=target_message_id,
+                    channel_id=channel_id,
+                    fail_if_not_exists=False,
+                )
+                return await interaction.channel.send(embed=embed, reference=ref)
+            return await interaction.followup.send(embed=embed)
+
+        # Identical conversations get the cached response without a round trip
+        cache_key = hashlib.blake2b(orjson.dumps(messages), digest_size=16).digest()
+        ai_response = _resp_cache.get(cache_key, "")
+        reply = None
+
+        # While the breaker is open every /ask fails fast instead of piling
+        # tasks onto a dead upstream for the full request timeout.
+        if not ai_response and _together_breaker.is_open():
+            await interaction.followup.send("⚠️ AI service is temporarily unavailable. Please try again in a moment.")
+            return
 
-            # Language Detection
+        if not ai_response:
+            # Placeholder goes out immediately so the user sees feedback
+            # within one round trip; the stream then edits it in place.
+            reply = await _send_or_reply(_build_embed("⏳ Thinking..."))
+            fut = asyncio.get_running_loop().create_future()
+            try:
+                _ask_queue.put_nowait((flat_prompt, fut))
+            except asyncio.QueueFull:
+                fut = None
+            if fut is not None:
+                async with interaction.channel.typing():
+                    batched = await fut
+                if batched:
+                    ai_response = batched
+                    _resp_cache[cache_key] = ai_response
+
+        if not ai_response:
+            last_edit = 0.0
             try:
-                detected_lang = detect(prompt)
-            except LangDetectException:
-                detected_lang = "en"  # Default to English
-
-            lang_instruction = {
-                "tl": "Please respond in Tagalog.",
-                "es": "Por favor responde en español.",
-                "fr": "Veuillez répondre en français.",
-                "ja": "日本語で答えてください。",
-                "ko": "한국어로 답변해 주세요。",
-                "zh": "请用中文回答。",
-                "ru": "Пожалуйста, отвечайте на русском языке。",
-                "ar": "من فضلك أجب بالعربية。",
-                "vi": "Vui lòng trả lời bằng tiếng Việt.",
-                "th": "กรุณาตอบเป็นภาษาไทย",
-                "id": "Silakan jawab dalam bahasa Indonesia"
-            }.get(detected_lang, "")
-
-            # Load conversation history from MongoDB (if available)
-            history = []
-            if conversations_collection:
-                if not bot.conversations[user_id]:
-                    history_docs = conversations_collection.find({"user_id": user_id}).sort("timestamp", -1).limit(5)
-                    for doc in history_docs:
-                        bot.conversations[user_id].append({
-                            "user": doc["prompt"],
-                            "assistant": doc["response"]
-                        })
-                    bot.conversations[user_id].reverse()  # Maintain order
-                history = bot.conversations[user_id][-5:]
-
-            # Build full prompt with language instruction
-            system_prompt = f"You are a helpful and friendly AI assistant named Neroniel AI. {lang_instruction}"
-            full_prompt = system_prompt
-            for msg in history:
-                full_prompt += f"User: {msg['user']}\nAssistant: {msg['assistant']}\n"
-            full_prompt += f"User: {prompt}\nAssistant:"
-
-            # Call Together AI using async aiohttp instead of requests
-            headers = {
-                "Authorization": f"Bearer {os.getenv('TOGETHER_API_KEY')}",
-                "Content-Type": "application/json"
-            }
-            payload = {
-                "model": "meta-llama/Llama-3-70b-chat-hf",
-                "prompt": full_prompt,
-                "max_tokens": 2048,
-                "temperature": 0.7
-            }
-
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.post(
-                    "https://api.together.xyz/v1/completions", 
-                    headers=headers,
+                async with interaction.channel.typing(), bot.http_session.post(
+                    "https://api.together.xyz/v1/chat/completions",
+                    headers=TOGETHER_HEADERS,
                     json=payload
                 ) as response:
                     if response.status != 200:
                         text = await response.text()
-                        await interaction.followup.send(f"❌ API returned error code {response.status}: `{text}`")
+                        _together_breaker.record_failure()
+                        await reply.edit(embed=_build_embed(f"❌ API returned error code {response.status}: `{text}`"))
                         return
-                    data = await response.json()
+                    async for raw_line in response.content:
+                        line = raw_line.decode("utf-8", errors="ignore").strip()
+                        if not line.startswith("data:"):
+                            continue
+                        chunk = line[len("data:"):].strip()
+                        if chunk == "[DONE]":
+                            break
+                        try:
+                            delta = orjson.loads(chunk)["choices"][0]["delta"].get("content", "")
+                        except (KeyError, IndexError, orjson.JSONDecodeError):
+                            continue
+                        if not delta:
+                            continue
+                        ai_response += delta
+                        # Throttle edits to stay under Discord's edit rate limit
+                        now_mono = asyncio.get_event_loop().time()
+                        if ai_response.strip() and now_mono - last_edit >= 0.75:
+                            if reply is None:
+                                reply = await _send_or_reply(_build_embed(ai_response))
+                            else:
+                                await reply.edit(embed=_build_embed(ai_response))
+                            last_edit = now_mono
 
-            if 'error' in data:
-                await interaction.followup.send(f"❌ Error from AI API: {data['error']['message']}")
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                _together_breaker.record_failure()
+                raise
+            _together_breaker.record_success()
+
+            ai_response = ai_response.strip()
+            if not ai_response:
+                await reply.edit(embed=_build_embed("❌ The AI returned an empty response."))
                 return
+            _resp_cache[cache_key] = ai_response
 
-            ai_response = data["choices"][0]["text"].strip()
+        # Final edit with the complete response
+        if reply is None:
+            reply = await _send_or_reply(_build_embed(ai_response))
+        else:
+            await reply.edit(embed=_build_embed(ai_response))
 
-            # Determine if we should reply to a previous message
-            target_message_id = bot.last_message_id.get((user_id, channel_id))
+        # Update the last message ID for future replies
+        bot.last_message_id[(user_id, channel_id)] = reply.id
 
-            # Send the AI response
-            embed = discord.Embed(description=ai_response, color=discord.Color.from_rgb(0, 0, 0))
-            embed.set_footer(text="Neroniel AI")
-            embed.timestamp = datetime.now(PH_TIMEZONE)
+        # Store in memory and MongoDB, keeping only the last 5 turns per user
+        user_history = bot.conversations.setdefault(user_id, [])
+        user_history.append({
+            "user": prompt,
+            "assistant": ai_response
+        })
+        del user_history[:-5]
 
-            if target_message_id:
-                try:
-                    msg = await interaction.channel.fetch_message(target_message_id)
-                    reply = await msg.reply(embed=embed)
-                except discord.NotFound:
-                    msg = await interaction.followup.send(embed=embed)
-                    reply = msg
-            else:
-                msg = await interaction.followup.send(embed=embed)
-                reply = msg
-
-            # Update the last message ID for future replies
-            bot.last_message_id[(user_id, channel_id)] = reply.id
-
-            # Store in memory and MongoDB
-            bot.conversations[user_id].append({
-                "user": prompt,
-                "assistant": ai_response
-            })
-
-            if conversations_collection:
-                conversations_collection.insert_one({
-                    "user_id": user_id,
-                    "prompt": prompt,
-                    "response": ai_response,
-                    "timestamp": datetime.now(PH_TIMEZONE)
-                })
+        if conversations_collection is not None:
+            bot._conv_buffer.append((user_id, {
+                "u": prompt,
+                "a": ai_response,
+                "t": datetime.now(PH_TIMEZONE)
+            }))
 
-        except Exception as e:
-            await interaction.followup.send(f"❌ Error: {str(e)}")
-            print(f"[EXCEPTION] /ask command error: {e}")
+    except Exception as e:
+        await interaction.followup.send(f"❌ Error: {str(e)}")
+        print(f"[EXCEPTION] /ask command error: {e}")
 
 # /clearhistory - Clear stored conversation history
 @bot.tree.command(name="clearhistory", description="Clear your AI conversation history")
 async def clearhistory(interaction: discord.Interaction):
     user_id = interaction.user.id
-    # Clear local memory
+    # Clear local memory; mark as loaded so the next /ask doesn't refetch the
+    # rows the background delete is about to remove
     if user_id in bot.conversations:
         bot.conversations[user_id].clear()
-    # Clear MongoDB history
-    if conversations_collection:
-        conversations_collection.delete_many({"user_id": user_id})
+    bot.conversations[user_id] = bot.conversations.get(user_id, [])
+    bot.history_loaded.add(user_id)
+    # Clear MongoDB history off the response path; memory is already clear so
+    # a subsequent /ask can't resurface old turns while the delete runs.
+    # The user's buffered turns must go too, or the next periodic flush
+    # would upsert them right back after the delete.
+    bot._conv_buffer[:] = [(uid, turn) for uid, turn in bot._conv_buffer if uid != user_id]
+    if conversations_collection is not None:
+        _spawn_bg(conversations_collection.delete_one({"_id": user_id}))
     await interaction.response.send_message("✅ Your AI conversation history has been cleared!", ephemeral=True)
 
 # ===========================
 # Utility Commands
 # ===========================
 
+# Shared datetime formatting for user-facing embeds
+_USERINFO_DT_FMT = "%B %d, %Y • %I:%M %p GMT+8"
+
+def _fmt_dt(dt, fallback="Unknown"):
+    return dt.astimezone(PH_TIMEZONE).strftime(_USERINFO_DT_FMT) if dt else fallback
+
 # /userinfo - Display user information
 @bot.tree.command(name="userinfo", description="Display detailed information about a user")
 @app_commands.describe(user="The user to get info for (optional, defaults to you)")
@@ -398,13 +845,13 @@ async def userinfo(interaction: discord.Interaction, user: discord.User = None):
     if user is None:
         user = interaction.user
 
-    created_at = user.created_at.astimezone(PH_TIMEZONE).strftime("%B %d, %Y • %I:%M %p GMT+8")
+    created_at = _fmt_dt(user.created_at)
 
     if isinstance(user, discord.Member):
-        joined_at = user.joined_at.astimezone(PH_TIMEZONE).strftime("%B %d, %Y • %I:%M %p GMT+8") if user.joined_at else "Unknown"
-        roles = [role.mention for role in user.roles if not role.is_default()]
+        joined_at = _fmt_dt(user.joined_at)
+        roles = [role.mention for role in user.roles[1:]]  # index 0 is always @everyone
         roles_str = ", ".join(roles) if roles else "No Roles"
-        boost_since = user.premium_since.astimezone(PH_TIMEZONE).strftime("%B %d, %Y • %I:%M %p GMT+8") if user.premium_since else "Not Boosting"
+        boost_since = _fmt_dt(user.premium_since, fallback="Not Boosting")
         is_bot = user.bot
     else:
         joined_at = "Not in Server"
@@ -439,7 +886,6 @@ async def userinfo(interaction: discord.Interaction, user: discord.User = None):
 @bot.tree.command(name="announcement", description="Send an embedded announcement to a specific channel")
 @app_commands.describe(message="The message to include in the announcement", channel="The channel to send the announcement to")
 async def announcement(interaction: discord.Interaction, message: str, channel: discord.TextChannel):
-    BOT_OWNER_ID = int(os.getenv("BOT_OWNER_ID"))
     is_owner = interaction.user.id == BOT_OWNER_ID
     is_admin = interaction.user.guild_permissions.administrator
     if not is_owner and not is_admin:
@@ -486,7 +932,7 @@ async def setrate(
         return
 
     guild_id = str(interaction.guild.id)
-    current_rates = get_current_rates(guild_id)
+    current_rates = await get_current_rates(guild_id)
 
     # Prepare new values, preserving existing ones if not provided
     new_rates = {
@@ -512,18 +958,19 @@ async def setrate(
         await interaction.followup.send(error_msg, ephemeral=True)
         return
 
+    now_ph = datetime.now(PH_TIMEZONE)
     update_data = {
         "guild_id": guild_id,
         "payout_rate": new_rates["payout_rate"],
         "gift_rate": new_rates["gift_rate"],
         "nct_rate": new_rates["nct_rate"],
         "ct_rate": new_rates["ct_rate"],
-        "updated_at": datetime.now(PH_TIMEZONE)
+        "updated_at": now_ph
     }
 
     try:
         if rates_collection is not None:
-            rates_collection.update_one(
+            await rates_collection.update_one(
                 {"guild_id": guild_id},
                 {"$set": update_data},
                 upsert=True
@@ -548,7 +995,7 @@ async def setrate(
                 embed.add_field(name=label, value=value, inline=False)
 
             embed.set_footer(text="Neroniel")
-            embed.timestamp = datetime.now(PH_TIMEZONE)
+            embed.timestamp = now_ph
 
             await interaction.followup.send(embed=embed)
         else:
@@ -602,7 +1049,7 @@ async def resetrate(
 
     try:
         if rates_collection is not None:
-            result = rates_collection.update_one(
+            result = await rates_collection.update_one(
                 {"guild_id": guild_id},
                 {"$set": update_data}
             )
@@ -636,185 +1083,109 @@ async def resetrate(
     except Exception as e:
         await interaction.followup.send(f"❌ Error resetting rates: {str(e)}", ephemeral=True)
 
-# Payout Rate
-@bot.tree.command(name="payout", description="Convert Robux to PHP based on current Payout rate")
-@app_commands.describe(robux="How much Robux do you want to convert?")
-async def payout(interaction: discord.Interaction, robux: int):
-    if robux <= 0:
-        await interaction.response.send_message("❗ Robux amount must be greater than zero.")
-        return
-
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    php = robux * (rates["payout"] / 1000)
-
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.add_field(name="Note:", value="To be eligible for a payout, you must be a member of the group for at least 14 days. Please ensure this requirement is met before proceeding with any transaction. You can view the Group Link by typing `/group` in the chat.", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
-
-@bot.tree.command(name="payoutreverse", description="Convert PHP to Robux based on current Payout rate")
-@app_commands.describe(php="How much PHP do you want to convert?")
-async def payoutreverse(interaction: discord.Interaction, php: float):
-    if php <= 0:
-        await interaction.response.send_message("❗ PHP amount must be greater than zero.")
-        return
-
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    robux = round((php / rates["payout"]) * 1000)
-
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.add_field(name="Note:", value="To be eligible for a payout, you must be a member of the group for at least 14 days. Please ensure this requirement is met before proceeding with any transaction. You can view the Group Link by typing `/group` in the chat.", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
-
-# Gift Rate
-@bot.tree.command(name="gift", description="Convert Robux to PHP based on current Gift rate")
-@app_commands.describe(robux="How much Robux do you want to convert?")
-async def gift(interaction: discord.Interaction, robux: int):
-    if robux <= 0:
-        await interaction.response.send_message("❗ Robux amount must be greater than zero.")
-        return
-
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    php = robux * (rates["gift"] / 1000)
-
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
-
-@bot.tree.command(name="giftreverse", description="Convert PHP to Robux based on current Gift rate")
-@app_commands.describe(php="How much PHP do you want to convert?")
-async def giftreverse(interaction: discord.Interaction, php: float):
-    if php <= 0:
-        await interaction.response.send_message("❗ PHP amount must be greater than zero.")
-        return
-
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    robux = round((php / rates["gift"]) * 1000)
-
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
-
-# NCT Rate
-@bot.tree.command(name="nct", description="Convert Robux to PHP based on current NCT rate")
-@app_commands.describe(robux="How much Robux do you want to convert?")
-async def nct(interaction: discord.Interaction, robux: int):
-    if robux <= 0:
-        await interaction.response.send_message("❗ Invalid input.")
-        return
-
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    php = robux * (rates["nct"] / 1000)
-
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.add_field(name="Note:", value="To proceed with this transaction, you must own the required Gamepass and have Regional Pricing disabled. Please ensure these requirements are met before proceeding with any transaction. You may view the Gamepass details by typing `/gamepass` in the chat and providing your Gamepass ID or Creator Dashboard URL.", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
-
-@bot.tree.command(name="nctreverse", description="Convert PHP to Robux based on current NCT rate")
-@app_commands.describe(php="How much PHP do you want to convert?")
-async def nctreverse(interaction: discord.Interaction, php: float):
-    if php <= 0:
-        await interaction.response.send_message("❗ PHP amount must be greater than zero.")
-        return
-
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    robux = round((php / rates["nct"]) * 1000)
+# Upper bound on amounts the conversion commands will do arithmetic on.
+# Discord options accept arbitrary-precision ints, so without a cap a 10**18
+# input still gets multiplied and formatted into an enormous string.
+MAX_AMOUNT = 1_000_000_000
+
+def positive(ephemeral=False, **params):
+    """Reject out-of-range numeric options with the given message per option."""
+    def deco(func):
+        @functools.wraps(func)
+        async def wrapper(interaction: discord.Interaction, **kwargs):
+            for name, message in params.items():
+                if kwargs[name] <= 0 or kwargs[name] > MAX_AMOUNT:
+                    await interaction.response.send_message(message, ephemeral=ephemeral)
+                    return
+            await func(interaction, **kwargs)
+        return wrapper
+    return deco
+
+# Robux <-> PHP conversion commands, generated from one table so the eight
+# near-identical handlers cannot drift apart.
+PAYOUT_NOTE = "To be eligible for a payout, you must be a member of the group for at least 14 days. Please ensure this requirement is met before proceeding with any transaction. You can view the Group Link by typing `/group` in the chat."
+GAMEPASS_NOTE = "To proceed with this transaction, you must own the required Gamepass and have Regional Pricing disabled. Please ensure these requirements are met before proceeding with any transaction. You may view the Gamepass details by typing `/gamepass` in the chat and providing your Gamepass ID or Creator Dashboard URL."
+
+_CONVERSION_COMMANDS = (
+    # (command name, rate key, label, note, forward-validation message)
+    ("payout", "payout", "Payout", PAYOUT_NOTE, "❗ Robux amount must be greater than zero."),
+    ("gift", "gift", "Gift", None, "❗ Robux amount must be greater than zero."),
+    ("nct", "nct", "NCT", GAMEPASS_NOTE, "❗ Invalid input."),
+    ("ct", "ct", "CT", GAMEPASS_NOTE, "❗ Invalid input."),
+)
 
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.add_field(name="Note:", value="To proceed with this transaction, you must own the required Gamepass and have Regional Pricing disabled. Please ensure these requirements are met before proceeding with any transaction. You may view the Gamepass details by typing `/gamepass` in the chat and providing your Gamepass ID or Creator Dashboard URL.", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
+def _make_forward(rate_key, note):
+    async def forward(interaction: discord.Interaction, robux: int):
+        rates = await get_current_rates(interaction.guild.id)
+        php = robux * (rates[rate_key] / 1000)
 
-# CT Rate 
-@bot.tree.command(name="ct", description="Convert Robux to PHP based on current CT rate")
-@app_commands.describe(robux="How much Robux do you want to convert?")
-async def ct(interaction: discord.Interaction, robux: int):
-    if robux <= 0:
-        await interaction.response.send_message("❗ Invalid input.")
-        return
+        embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
+        embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
+        embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
+        if note:
+            embed.add_field(name="Note:", value=note, inline=False)
+        embed.set_footer(text="Neroniel")
+        embed.timestamp = datetime.now(PH_TIMEZONE)
+        await interaction.response.send_message(embed=embed)
+    return forward
 
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    php = robux * (rates["ct"] / 1000)
+def _php_to_robux(php, rate):
+    # Exact integer arithmetic in centavos: no float division in the middle,
+    # so inputs like 239.999... can't land one Robux off the expected value.
+    php_centavos = int(round(php * 100))
+    rate_centavos = int(round(rate * 100))
+    return (php_centavos * 1000 + rate_centavos // 2) // rate_centavos
 
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.add_field(name="Note:", value="To proceed with this transaction, you must own the required Gamepass and have Regional Pricing disabled. Please ensure these requirements are met before proceeding with any transaction. You may view the Gamepass details by typing `/gamepass` in the chat and providing your Gamepass ID or Creator Dashboard URL.", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
+def _make_reverse(rate_key, note):
+    async def reverse(interaction: discord.Interaction, php: float):
+        rates = await get_current_rates(interaction.guild.id)
+        robux = _php_to_robux(php, rates[rate_key])
 
-@bot.tree.command(name="ctreverse", description="Convert PHP to Robux based on current CT rate")
-@app_commands.describe(php="How much PHP do you want to convert?")
-async def ctreverse(interaction: discord.Interaction, php: float):
-    if php <= 0:
-        await interaction.response.send_message("❗ PHP amount must be greater than zero.")
-        return
+        embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
+        embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
+        embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
+        if note:
+            embed.add_field(name="Note:", value=note, inline=False)
+        embed.set_footer(text="Neroniel")
+        embed.timestamp = datetime.now(PH_TIMEZONE)
+        await interaction.response.send_message(embed=embed)
+    return reverse
 
-    guild_id = interaction.guild.id
-    rates = get_current_rates(guild_id)
-    robux = round((php / rates["ct"]) * 1000)
+for _name, _rate_key, _label, _note, _invalid_msg in _CONVERSION_COMMANDS:
+    _forward = positive(robux=_invalid_msg)(_make_forward(_rate_key, _note))
+    _forward.__name__ = _name
+    _forward = app_commands.describe(robux="How much Robux do you want to convert?")(_forward)
+    bot.tree.command(name=_name, description=f"Convert Robux to PHP based on current {_label} rate")(_forward)
 
-    embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-    embed.add_field(name="Payment:", value=f"₱{php:.2f} PHP", inline=False)
-    embed.add_field(name="Amount:", value=f"{robux} Robux", inline=False)
-    embed.add_field(name="Note:", value="To proceed with this transaction, you must own the required Gamepass and have Regional Pricing disabled. Please ensure these requirements are met before proceeding with any transaction. You may view the Gamepass details by typing `/gamepass` in the chat and providing your Gamepass ID or Creator Dashboard URL.", inline=False)
-    embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
-    await interaction.response.send_message(embed=embed)
+    _reverse = positive(php="❗ PHP amount must be greater than zero.")(_make_reverse(_rate_key, _note))
+    _reverse.__name__ = f"{_name}reverse"
+    _reverse = app_commands.describe(php="How much PHP do you want to convert?")(_reverse)
+    bot.tree.command(name=f"{_name}reverse", description=f"Convert PHP to Robux based on current {_label} rate")(_reverse)
 
 # All Rates Comparison
+# Label ordering for the rate-comparison embeds, built once instead of a
+# fresh dict per invocation. The rates themselves stay per-guild.
+_RATE_LABELS = (
+    ("Payout Rate", "payout"),
+    ("Gift Rate", "gift"),
+    ("NCT Rate", "nct"),
+    ("CT Rate", "ct"),
+)
+
 @bot.tree.command(name="allrates", description="See PHP equivalent across all rates for given Robux")
 @app_commands.describe(robux="How much Robux do you want to compare?")
+@positive(ephemeral=True, robux="❗ Robux amount must be greater than zero.")
 async def allrates(interaction: discord.Interaction, robux: int):
-    if robux <= 0:
-        await interaction.response.send_message("❗ Robux amount must be greater than zero.", ephemeral=True)
-        return
-
     guild_id = str(interaction.guild.id)
-    rates = get_current_rates(guild_id)
+    rates = await get_current_rates(guild_id)
 
     embed = discord.Embed(
         title=f"Robux Conversion Rates ({robux} Robux)",
         color=discord.Color.from_rgb(0, 0, 0)
     )
 
-    conversion_data = {
-        "Payout Rate": rates["payout"],
-        "Gift Rate": rates["gift"],
-        "NCT Rate": rates["nct"],
-        "CT Rate": rates["ct"]
-    }
-
-    for label, rate in conversion_data.items():
-        php_value = (rate / 1000) * robux
+    for label, key in _RATE_LABELS:
+        php_value = (rates[key] / 1000) * robux
         embed.add_field(
             name=f"• {label}",
             value=f"₱{php_value:.2f}",
@@ -828,28 +1199,18 @@ async def allrates(interaction: discord.Interaction, robux: int):
 
 @bot.tree.command(name="allratesreverse", description="See Robux equivalent across all rates for given PHP")
 @app_commands.describe(php="How much PHP do you want to compare?")
+@positive(ephemeral=True, php="❗ PHP amount must be greater than zero.")
 async def allratesreverse(interaction: discord.Interaction, php: float):
-    if php <= 0:
-        await interaction.response.send_message("❗ PHP amount must be greater than zero.", ephemeral=True)
-        return
-
     guild_id = str(interaction.guild.id)
-    rates = get_current_rates(guild_id)
+    rates = await get_current_rates(guild_id)
 
     embed = discord.Embed(
         title="PHP to Robux Conversion",
         color=discord.Color.from_rgb(0, 0, 0)
     )
 
-    conversion_data = {
-        "Payout Rate": rates["payout"],
-        "Gift Rate": rates["gift"],
-        "NCT Rate": rates["nct"],
-        "CT Rate": rates["ct"]
-    }
-
-    for label, rate in conversion_data.items():
-        robux_value = round((php / rate) * 1000)
+    for label, key in _RATE_LABELS:
+        robux_value = _php_to_robux(php, rates[key])
         embed.add_field(
             name=f"• {label}",
             value=f"{robux_value} Robux",
@@ -864,12 +1225,10 @@ async def allratesreverse(interaction: discord.Interaction, php: float):
 # Tax Calculations
 @bot.tree.command(name="beforetax", description="Calculate how much Robux you'll receive after 30% tax")
 @app_commands.describe(robux="How much Robux is being sent?")
+@positive(robux="❗ Robux amount must be greater than zero.")
 async def beforetax(interaction: discord.Interaction, robux: int):
-    if robux <= 0:
-        await interaction.response.send_message("❗ Robux amount must be greater than zero.")
-        return
-
-    received = math.floor(robux * 0.7)
+    # 30% fee: exact integer arithmetic, no float rounding at the boundary
+    received = (robux * 7) // 10
 
     embed = discord.Embed(
         color=discord.Color.from_rgb(0, 0, 0)
@@ -888,12 +1247,10 @@ async def beforetax(interaction: discord.Interaction, robux: int):
 
 @bot.tree.command(name="aftertax", description="Calculate how much Robux to send to receive desired amount after 30% tax")
 @app_commands.describe(target="How much Robux do you want to receive after tax?")
+@positive(target="❗ Target Robux must be greater than zero.")
 async def aftertax(interaction: discord.Interaction, target: int):
-    if target <= 0:
-        await interaction.response.send_message("❗ Target Robux must be greater than zero.")
-        return
-
-    sent = math.ceil(target / 0.7)
+    # ceil(target / 0.7) without the float round-trip
+    sent = (target * 10 + 6) // 7
 
     embed = discord.Embed(
         color=discord.Color.from_rgb(0, 0, 0)
@@ -911,62 +1268,129 @@ async def aftertax(interaction: discord.Interaction, target: int):
     await interaction.response.send_message(embed=embed)
 
 # ConvertCurrency
+# Exchange rates barely move minute-to-minute; cache each pair for 6 hours
+# and fall back to the last good value when the API errors.
+_FX_TTL = 21600
+_fx_cache = {}  # (from_currency, to_currency) -> (rate, fetched_at_monotonic)
+
+# Static embed skeletons; handlers copy one and fill in the dynamic fields.
+_FX_EMBED_TEMPLATE = discord.Embed(title="💱 Currency Conversion", color=discord.Color.gold())
+
+# Coalesce identical in-flight lookups: the first caller performs the GET and
+# everyone who asks for the same key while it is outstanding awaits the same
+# future, so N concurrent /weather Manila calls cost one outbound request.
+_inflight = {}
+
+async def _coalesced_get_json(key, url, params=None):
+    fut = _inflight.get(key)
+    if fut is None:
+        fut = asyncio.get_running_loop().create_future()
+        _inflight[key] = fut
+        try:
+            async with bot.http_session.get(url, params=params) as response:
+                fut.set_result(await response.json())
+        except Exception as e:
+            fut.set_exception(e)
+        finally:
+            _inflight.pop(key, None)
+    return await fut
+
+# TTL cache over the coalesced fetch for endpoints whose data changes slowly
+# (group metadata shared by /group and the presence refresh). Expiry gets a
+# little jitter so cached endpoints don't all refresh in lockstep. The
+# backing store is bounded because /weather keys entries by user input;
+# its ttl is a hard ceiling above every per-entry deadline.
+_ttl_cache = TTLCache(maxsize=512, ttl=900)
+
+async def cached_get(key, url, ttl=60):
+    entry = _ttl_cache.get(key)
+    if entry is not None and time.monotonic() < entry[1]:
+        return entry[0]
+    data = await _coalesced_get_json(key, url)
+    _ttl_cache[key] = (data, time.monotonic() + ttl + random.uniform(0, 5))
+    return data
+
 @bot.tree.command(name="convertcurrency", description="Convert between two currencies")
 @app_commands.describe(amount="Amount to convert", from_currency="Currency to convert from (e.g., USD)", to_currency="Currency to convert to (e.g., PHP)")
 async def convertcurrency(interaction: discord.Interaction, amount: float, from_currency: str, to_currency: str):
+    # Defer up front: a cold rate fetch can outlive the 3-second token window
+    await interaction.response.defer()
     api_key = os.getenv("CURRENCY_API_KEY")
     if not api_key:
-        await interaction.response.send_message("❌ `CURRENCY_API_KEY` missing.", ephemeral=True)
+        await interaction.followup.send("❌ `CURRENCY_API_KEY` missing.")
         return
     from_currency = from_currency.upper()
     to_currency = to_currency.upper()
-    url = f"https://api.currencyapi.com/v3/latest?apikey= {api_key}&currencies={to_currency}&base_currency={from_currency}"
-    try:
-        response = requests.get(url)
-        data = response.json()
-        if 'error' in data:
-            await interaction.response.send_message(f"❌ API Error: {data['error']['message']}")
-            print("API Error Response:", data)
-            return
-        if "data" not in data or to_currency not in data["data"]:
-            await interaction.response.send_message("❌ Invalid currency code or no data found.")
-            return
-        rate = data["data"][to_currency]["value"]
-        result = amount * rate
-        embed = discord.Embed(title=f"💱 Currency Conversion", color=discord.Color.gold())
-        embed.add_field(name="📥 Input", value=f"{amount} {from_currency}", inline=False)
-        embed.add_field(name="📉 Rate", value=f"1 {from_currency} = {rate:.4f} {to_currency}", inline=False)
-        embed.add_field(name="📤 Result", value=f"≈ **{result:.2f} {to_currency}**", inline=False)
-        embed.set_footer(text="Neroniel")
-        embed.timestamp = datetime.now(PH_TIMEZONE)
-        await interaction.response.send_message(embed=embed)
-    except Exception as e:
-        await interaction.response.send_message(f"❌ Error during conversion: {str(e)}")
-        print("Exception Details:", str(e))
+
+    pair = (from_currency, to_currency)
+    cached = _fx_cache.get(pair)
+    rate = None
+    stale = False
+
+    if cached is not None and time.monotonic() - cached[1] < _FX_TTL:
+        rate = cached[0]
+    else:
+        params = {"apikey": api_key, "currencies": to_currency, "base_currency": from_currency}
+        try:
+            data = await _coalesced_get_json(("fx",) + pair, "https://api.currencyapi.com/v3/latest", params)
+            if 'error' in data:
+                print("API Error Response:", data)
+            elif "data" in data and to_currency in data["data"]:
+                rate = data["data"][to_currency]["value"]
+                _fx_cache[pair] = (rate, time.monotonic())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print("Exception Details:", str(e))
+
+        if rate is None:
+            if cached is not None:
+                rate = cached[0]
+                stale = True
+            else:
+                await interaction.followup.send("❌ Invalid currency code or no data found.")
+                return
+
+    result = amount * rate
+    embed = _FX_EMBED_TEMPLATE.copy()
+    embed.add_field(name="📥 Input", value=f"{amount} {from_currency}", inline=False)
+    embed.add_field(name="📉 Rate", value=f"1 {from_currency} = {rate:.4f} {to_currency}", inline=False)
+    embed.add_field(name="📤 Result", value=f"≈ **{result:.2f} {to_currency}**", inline=False)
+    embed.set_footer(text="Neroniel (stale rate)" if stale else "Neroniel")
+    embed.timestamp = datetime.now(PH_TIMEZONE)
+    await interaction.followup.send(embed=embed)
+
+# Full list of supported currencies with names, plus a lowercase index
+# built once so the per-keystroke autocomplete is a single pass.
+_CURRENCIES = (
+    "USD - US Dollar", "EUR - Euro", "JPY - Japanese Yen", "GBP - British Pound",
+    "AUD - Australian Dollar", "CAD - Canadian Dollar", "CHF - Swiss Franc",
+    "CNY - Chinese Yuan", "SEK - Swedish Krona", "NZD - New Zealand Dollar",
+    "BRL - Brazilian Real", "INR - Indian Rupee", "RUB - Russian Ruble",
+    "ZAR - South African Rand", "SGD - Singapore Dollar", "HKD - Hong Kong Dollar",
+    "KRW - South Korean Won", "MXN - Mexican Peso", "TRY - Turkish Lira",
+    "EGP - Egyptian Pound", "AED - UAE Dirham", "SAR - Saudi Riyal",
+    "ARS - Argentine Peso", "CLP - Chilean Peso", "THB - Thai Baht",
+    "MYR - Malaysian Ringgit", "IDR - Indonesian Rupiah", "PHP - Philippine Peso",
+    "PLN - Polish Zloty"
+)
+_CURRENCIES_LC = tuple(c.lower() for c in _CURRENCIES)
+# Choice objects are immutable, so build them once and hand back references
+_CURRENCY_CHOICES = tuple(
+    app_commands.Choice(name=c, value=c.split(" ")[0]) for c in _CURRENCIES
+)
 
 @convertcurrency.autocomplete('from_currency')
 @convertcurrency.autocomplete('to_currency')
 async def currency_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
-    # Full list of supported currencies with names
-    currencies = [
-        "USD - US Dollar", "EUR - Euro", "JPY - Japanese Yen", "GBP - British Pound",
-        "AUD - Australian Dollar", "CAD - Canadian Dollar", "CHF - Swiss Franc",
-        "CNY - Chinese Yuan", "SEK - Swedish Krona", "NZD - New Zealand Dollar",
-        "BRL - Brazilian Real", "INR - Indian Rupee", "RUB - Russian Ruble",
-        "ZAR - South African Rand", "SGD - Singapore Dollar", "HKD - Hong Kong Dollar",
-        "KRW - South Korean Won", "MXN - Mexican Peso", "TRY - Turkish Lira",
-        "EGP - Egyptian Pound", "AED - UAE Dirham", "SAR - Saudi Riyal",
-        "ARS - Argentine Peso", "CLP - Chilean Peso", "THB - Thai Baht",
-        "MYR - Malaysian Ringgit", "IDR - Indonesian Rupiah", "PHP - Philippine Peso",
-        "PLN - Polish Zloty"
-    ]
-    filtered = [c for c in currencies if current.lower() in c.lower()]
-    return [
-        app_commands.Choice(name=c, value=c.split(" ")[0])
-        for c in filtered[:25]
-    ]
+    q = current.lower()
+    matches = []
+    for choice, lc in zip(_CURRENCY_CHOICES, _CURRENCIES_LC):
+        if q in lc:
+            matches.append(choice)
+            if len(matches) == 25:
+                break
+    return matches
 
 # ========== Weather Command ==========
 PHILIPPINE_CITIES = [
@@ -991,8 +1415,21 @@ GLOBAL_CAPITAL_CITIES = [
     "Beijing", "Shanghai", "Tokyo", "Seoul", "Sydney", "Melbourne"
 ]
 
+# Merged, deduplicated (both source lists contain repeats) and frozen once
+# so autocomplete doesn't concatenate the lists on every keystroke. The
+# lowercase shadow list is paired by index so matching never re-lowers.
+_ALL_CITIES = tuple(dict.fromkeys(PHILIPPINE_CITIES + GLOBAL_CAPITAL_CITIES))
+_ALL_CITIES_LC = tuple(c.lower() for c in _ALL_CITIES)
 
 
+# Parsed once; per-call URLs are derived by swapping the query or appending a
+# path segment instead of f-string templating and re-parsing.
+_WEATHER_URL = yarl.URL("http://api.weatherapi.com/v1/current.json")
+# Current-conditions data updates on the order of minutes, so repeated
+# lookups for the same city within five minutes reuse the cached payload.
+_WEATHER_TTL = 300
+_GROUPS_API_URL = yarl.URL("https://groups.roblox.com/v1/groups")
+
 @bot.tree.command(name="weather", description="Get weather information for a city")
 @app_commands.describe(city="City name", unit="Temperature unit (default is Celsius)")
 @app_commands.choices(unit=[
@@ -1004,57 +1441,63 @@ async def weather(interaction: discord.Interaction, city: str, unit: str = "c"):
     if not api_key:
         await interaction.response.send_message("❌ Weather API key is missing.", ephemeral=True)
         return
-    url = f"http://api.weatherapi.com/v1/current.json?key={api_key}&q={city}"
+    url = _WEATHER_URL.update_query(key=api_key, q=city)
     try:
-        response = requests.get(url)
-        data = response.json()
-        if "error" in data:
-            await interaction.response.send_message("❌ City not found or invalid input.", ephemeral=True)
-            return
-        current = data["current"]
-        location = data["location"]["name"]
-        region = data["location"]["region"]
-        country = data["location"]["country"]
-        if unit == "c":
-            temperature = current["temp_c"]
-            feels_like = current["feelslike_c"]
-            unit_label = "°C"
-        else:
-            temperature = current["temp_f"]
-            feels_like = current["feelslike_f"]
-            unit_label = "°F"
-        humidity = current["humidity"]
-        wind_kph = current["wind_kph"]
-        condition = current["condition"][0]["text"]
-        icon_url = f"https:{current['condition'][0]['icon']}"
-
-        embed = discord.Embed(
-            title=f"🌤️ Weather in {location}, {region}, {country}",
-            color=discord.Color.from_rgb(0, 0, 0)
-        )
-        embed.add_field(name="🌡️ Temperature", value=f"{temperature}{unit_label}", inline=True)
-        embed.add_field(name="🧯 Feels Like", value=f"{feels_like}{unit_label}", inline=True)
-        embed.add_field(name="💧 Humidity", value=f"{humidity}%", inline=True)
-        embed.add_field(name="🌬️ Wind Speed", value=f"{wind_kph} km/h", inline=True)
-        embed.add_field(name="📝 Condition", value=condition, inline=False)
-        embed.set_thumbnail(url=icon_url)
-        embed.set_footer(text="Powered by WeatherAPI • Neroniel")
-        embed.timestamp = datetime.now(PH_TIMEZONE)
-        await interaction.response.send_message(embed=embed)
-    except Exception as e:
+        data = await cached_get(("weather", city.lower()), url, ttl=_WEATHER_TTL)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         await interaction.response.send_message(f"❌ Error fetching weather: {str(e)}", ephemeral=True)
+        return
+    if "error" in data:
+        # Don't let a junk city name occupy a cache slot for the full TTL
+        _ttl_cache.pop(("weather", city.lower()), None)
+        await interaction.response.send_message("❌ City not found or invalid input.", ephemeral=True)
+        return
+    current = data["current"]
+    location = data["location"]["name"]
+    region = data["location"]["region"]
+    country = data["location"]["country"]
+    if unit == "c":
+        temperature = current["temp_c"]
+        feels_like = current["feelslike_c"]
+        unit_label = "°C"
+    else:
+        temperature = current["temp_f"]
+        feels_like = current["feelslike_f"]
+        unit_label = "°F"
+    humidity = current["humidity"]
+    wind_kph = current["wind_kph"]
+    condition = current["condition"][0]["text"]
+    icon_url = f"https:{current['condition'][0]['icon']}"
+
+    embed = discord.Embed(
+        title=f"🌤️ Weather in {location}, {region}, {country}",
+        color=discord.Color.from_rgb(0, 0, 0)
+    )
+    embed.add_field(name="🌡️ Temperature", value=f"{temperature}{unit_label}", inline=True)
+    embed.add_field(name="🧯 Feels Like", value=f"{feels_like}{unit_label}", inline=True)
+    embed.add_field(name="💧 Humidity", value=f"{humidity}%", inline=True)
+    embed.add_field(name="🌬️ Wind Speed", value=f"{wind_kph} km/h", inline=True)
+    embed.add_field(name="📝 Condition", value=condition, inline=False)
+    embed.set_thumbnail(url=icon_url)
+    embed.set_footer(text="Powered by WeatherAPI • Neroniel")
+    embed.timestamp = datetime.now(PH_TIMEZONE)
+    await interaction.response.send_message(embed=embed)
 
 @weather.autocomplete('city')
 async def city_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
-    # Combine Philippine and global capitals
-    all_cities = PHILIPPINE_CITIES + GLOBAL_CAPITAL_CITIES
-    # Filter based on user input
-    filtered = [c for c in all_cities if current.lower() in c.lower()]
+    # Prefix matches rank ahead of substring matches so typing "Ma" suggests
+    # Manila/Makati before Zamboanga.
+    q = current.lower()
+    prefix = [c for c, lc in zip(_ALL_CITIES, _ALL_CITIES_LC) if lc.startswith(q)]
+    substring = [
+        c for c, lc in zip(_ALL_CITIES, _ALL_CITIES_LC)
+        if q in lc and not lc.startswith(q)
+    ]
     return [
         app_commands.Choice(name=c, value=c)
-        for c in filtered[:25]
+        for c in (prefix + substring)[:25]
     ]
 
 # ===========================
@@ -1069,41 +1512,67 @@ async def purge(interaction: discord.Interaction, amount: int):
         await interaction.response.send_message("❗ Please specify a positive number of messages.", ephemeral=True)
         return
 
-    BOT_OWNER_ID = int(os.getenv("BOT_OWNER_ID"))
-    has_permission = interaction.user.guild_permissions.manage_messages or interaction.user.id == BOT_OWNER_ID
-    if not has_permission:
+    # .guild_permissions rebuilds a Permissions object from the role set on
+    # every access, so resolve each one exactly once.
+    user_perms = interaction.user.guild_permissions
+    me_perms = interaction.guild.me.guild_permissions
+    if not (user_perms.manage_messages or interaction.user.id == BOT_OWNER_ID):
         await interaction.response.send_message("❗ You don't have permission to use this command.", ephemeral=True)
         return
 
-    if not interaction.guild.me.guild_permissions.manage_messages:
+    if not me_perms.manage_messages:
         await interaction.response.send_message("❗ I don't have permission to delete messages.", ephemeral=True)
         return
 
     await interaction.response.defer(ephemeral=True)
-    deleted = await interaction.channel.purge(limit=amount)
-    await interaction.followup.send(f"✅ Deleted **{len(deleted)}** messages.", ephemeral=True)
+    # Bulk-delete endpoint takes up to 100 messages per call but rejects
+    # anything older than 14 days; firing the chunks concurrently turns a
+    # sequential purge into roughly one round trip.
+    cutoff = datetime.now(timezone.utc) - timedelta(days=14)
+    recent = []
+    old = []
+    async for msg in interaction.channel.history(limit=amount):
+        (recent if msg.created_at > cutoff else old).append(msg)
+    chunks = [recent[i:i + 100] for i in range(0, len(recent), 100)]
+    await asyncio.gather(*(interaction.channel.delete_messages(chunk) for chunk in chunks))
+    for msg in old:
+        await msg.delete()
+    await interaction.followup.send(f"✅ Deleted **{len(recent) + len(old)}** messages.", ephemeral=True)
 
 # Group Info Command
+# Group metadata changes slowly; a short TTL absorbs command-spam bursts.
+_GROUP_TTL = 60
+
+_GROUP_EMBED_TEMPLATE = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
+_GROUP_EMBED_TEMPLATE.set_footer(text="Neroniel")
+
 @bot.tree.command(name="group", description="Display information about the 1cy Roblox group")
 async def groupinfo(interaction: discord.Interaction):
+    await interaction.response.defer()
     GROUP_ID = int(os.getenv("GROUP_ID"))
     try:
-        response = requests.get(f"https://groups.roblox.com/v1/groups/{GROUP_ID}")
-        data = response.json()
-        formatted_members = "{:,}".format(data['memberCount'])
-        embed = discord.Embed(color=discord.Color.from_rgb(0, 0, 0))
-        embed.add_field(name="Group Name", value=f"[{data['name']}](https://www.roblox.com/groups/{GROUP_ID})", inline=False)
-        embed.add_field(name="Description", value=f"```\n{data.get('description', 'No description')}\n```", inline=False)
-        embed.add_field(name="Group ID", value=str(data['id']), inline=True)
-        owner = data.get('owner')
-        owner_link = f"[{owner['username']}](https://www.roblox.com/users/{owner['userId']}/profile)" if owner else "No Owner"
-        embed.add_field(name="Owner", value=owner_link, inline=True)
-        embed.add_field(name="Members", value=formatted_members, inline=True)
-        embed.set_footer(text="Neroniel")
-        embed.timestamp = discord.utils.utcnow()
-        await interaction.response.send_message(embed=embed)
-    except Exception as e:
-        await interaction.response.send_message(f"❌ Error fetching group info: {e}", ephemeral=True)
+        data = await cached_get(("group", GROUP_ID), _GROUPS_API_URL / str(GROUP_ID), ttl=_GROUP_TTL)
+        # Parse inside the try: a 429/5xx body is {"errors": [...]} and the
+        # key access raising here must not strand the deferred interaction.
+        formatted_members = f"{data['memberCount']:,}"
+        group_name = data['name']
+        group_id_value = data['id']
+    except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError) as e:
+        # Evict the bad payload so the next call refetches instead of
+        # re-raising from the cache for the rest of the TTL.
+        _ttl_cache.pop(("group", GROUP_ID), None)
+        await interaction.followup.send(f"❌ Error fetching group info: {e}")
+        return
+    embed = _GROUP_EMBED_TEMPLATE.copy()
+    embed.add_field(name="Group Name", value=f"[{group_name}](https://www.roblox.com/groups/{GROUP_ID})", inline=False)
+    embed.add_field(name="Description", value=f"```\n{data.get('description', 'No description')}\n```", inline=False)
+    embed.add_field(name="Group ID", value=str(group_id_value), inline=True)
+    owner = data.get('owner')
+    owner_link = f"[{owner['username']}](https://www.roblox.com/users/{owner['userId']}/profile)" if owner else "No Owner"
+    embed.add_field(name="Owner", value=owner_link, inline=True)
+    embed.add_field(name="Members", value=formatted_members, inline=True)
+    embed.timestamp = discord.utils.utcnow()
+    await interaction.followup.send(embed=embed)
 
 # Poll Command
 @bot.tree.command(name="poll", description="Create a poll with reactions and result summary")
@@ -1114,58 +1583,90 @@ async def groupinfo(interaction: discord.Interaction):
     app_commands.Choice(name="Hours", value="hours")
 ])
 async def poll(interaction: discord.Interaction, question: str, amount: int, unit: app_commands.Choice[str]):
+    await interaction.response.defer(ephemeral=True)
     if amount <= 0:
-        await interaction.response.send_message("❗ Amount must be greater than zero.", ephemeral=True)
+        await interaction.followup.send("❗ Amount must be greater than zero.", ephemeral=True)
         return
     total_seconds = {"seconds": amount, "minutes": amount * 60, "hours": amount * 3600}.get(unit.value, 0)
     if total_seconds == 0:
-        await interaction.response.send_message("❗ Invalid time unit selected.", ephemeral=True)
+        await interaction.followup.send("❗ Invalid time unit selected.", ephemeral=True)
         return
     if total_seconds > 86400:
-        await interaction.response.send_message("❗ Duration cannot exceed 24 hours.", ephemeral=True)
+        await interaction.followup.send("❗ Duration cannot exceed 24 hours.", ephemeral=True)
         return
+    # One "now" per invocation: the embed timestamp and the stored end time
+    # both derive from it, so the poll can't drift by the send round trips.
+    now = discord.utils.utcnow()
     embed = discord.Embed(title="📊 Poll", description=question, color=discord.Color.orange())
     embed.set_footer(text="Neroniel")
-    embed.timestamp = discord.utils.utcnow()
+    embed.timestamp = now
     message = await interaction.channel.send(embed=embed)
-    await message.add_reaction("👍")
-    await message.add_reaction("👎")
-    await interaction.response.send_message("✅ Poll created!", ephemeral=True)
+    await asyncio.gather(message.add_reaction("👍"), message.add_reaction("👎"))
+    await interaction.followup.send("✅ Poll created!", ephemeral=True)
+    # Persist long polls so they survive restarts and don't pin a Task for
+    # hours; sub-minute polls stay inline since the sweeper ticks every 60s.
+    if reminders_collection is not None and total_seconds >= 60:
+        await reminders_collection.insert_one({
+            "type": "poll",
+            "channel_id": interaction.channel.id,
+            "message_id": message.id,
+            "question": question,
+            "reminder_time": now + timedelta(seconds=total_seconds)
+        })
+        return
     await asyncio.sleep(total_seconds)
-    message = await interaction.channel.fetch_message(message.id)
-    reactions = message.reactions
-    up_count = next((r.count for r in reactions if str(r.emoji) == "👍"), 0)
-    down_count = next((r.count for r in reactions if str(r.emoji) == "👎"), 0)
-    if up_count > down_count:
-        result = "👍 Upvotes win!"
-    elif down_count > up_count:
-        result = "👎 Downvotes win!"
-    else:
-        result = "⚖️ It's a tie!"
-    result_embed = discord.Embed(title="📊 Poll Results", description=question, color=discord.Color.green())
-    result_embed.add_field(name="👍 Upvotes", value=str(up_count), inline=True)
-    result_embed.add_field(name="👎 Downvotes", value=str(down_count), inline=True)
-    result_embed.add_field(name="Result", value=result, inline=False)
-    result_embed.set_footer(text="Poll has ended")
-    result_embed.timestamp = discord.utils.utcnow()
-    await message.edit(embed=result_embed)
+    await _finish_poll(interaction.channel, message.id, question)
 
 # Remind Me Command
+async def _fire_reminder_soon(reminder_id, delay, channel, user, note):
+    await asyncio.sleep(delay)
+    # Delete-first makes delivery exactly-once: whichever of this timer and
+    # the minute sweeper removes the document gets to send the ping.
+    result = await reminders_collection.delete_one({"_id": reminder_id})
+    if result.deleted_count:
+        try:
+            await channel.send(f"🔔 {user.mention}, reminder: {note}")
+        except discord.Forbidden:
+            print("[!] Cannot send reminder (missing permissions)")
+
 @bot.tree.command(name="remindme", description="Set a reminder after X minutes (will ping you in this channel)")
 @app_commands.describe(minutes="How many minutes until I remind you?", note="Your reminder message")
 async def remindme(interaction: discord.Interaction, minutes: int, note: str):
     if minutes <= 0:
         await interaction.response.send_message("❗ Please enter a positive number of minutes.", ephemeral=True)
         return
-    reminder_time = datetime.utcnow() + timedelta(minutes=minutes)
-    if reminders_collection:
-        reminders_collection.insert_one({
+    reminder_time = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+    if reminders_collection is not None:
+        doc = {
             "user_id": interaction.user.id,
             "guild_id": interaction.guild.id,
             "channel_id": interaction.channel.id,
             "note": note,
             "reminder_time": reminder_time
-        })
+        }
+        if minutes < 60:
+            # Flags the in-process timer below so the sweeper claims this
+            # doc with a delete before sending instead of its grouped path.
+            doc["timer"] = True
+        try:
+            result = await reminders_collection.insert_one(doc)
+        except Exception as e:
+            # A Mongo outage shouldn't leave the interaction hanging, but
+            # confirming a reminder that was never stored would be worse.
+            print(f"[!] Failed to store reminder: {e}")
+            await interaction.response.send_message(
+                "❌ Couldn't save your reminder right now. Please try again later.",
+                ephemeral=True
+            )
+            return
+        # Short reminders also get an in-process timer so they land on the
+        # second instead of at the next 60s sweep; Mongo stays the source of
+        # truth so they still survive a restart.
+        if minutes < 60:
+            _spawn_bg(_fire_reminder_soon(
+                result.inserted_id, minutes * 60,
+                interaction.channel, interaction.user, note
+            ))
     await interaction.response.send_message(
         f"⏰ I'll remind you in `{minutes}` minutes: `{note}`",
         ephemeral=True
@@ -1183,16 +1684,24 @@ async def donate(interaction: discord.Interaction, user: discord.Member, amount:
     )
 
 # Say Command
+
 @bot.tree.command(name="say", description="Make the bot say something in chat (no @everyone/@here allowed)")
 @app_commands.describe(message="Message for the bot to say")
 async def say(interaction: discord.Interaction, message: str):
-    if "@everyone" in message or "@here" in message:
-        await interaction.response.send_message("❌ No @everyone/@here allowed.", ephemeral=True)
-        return
-    await interaction.channel.send(message)
+    # Let Discord suppress the pings server-side instead of scanning for
+    # them: immune to spacing/unicode tricks and costs nothing per call.
+    await interaction.channel.send(message, allowed_mentions=discord.AllowedMentions.none())
     await interaction.response.send_message("✅ Message sent!", ephemeral=True)
 
 # Calculator Command
+# Operation dispatch table: one dict lookup instead of an if/elif chain
+_CALC_OPS = {
+    "add": (operator.add, "+"),
+    "subtract": (operator.sub, "-"),
+    "multiply": (operator.mul, "*"),
+    "divide": (operator.truediv, "/"),
+}
+
 @bot.tree.command(name="calculator", description="Perform basic math operations")
 @app_commands.describe(num1="First number", operation="Operation", num2="Second number")
 @app_commands.choices(operation=[
@@ -1205,47 +1714,20 @@ async def calculator(interaction: discord.Interaction, num1: float, operation: a
     if operation.value == "divide" and num2 == 0:
         await interaction.response.send_message("❌ Cannot divide by zero.", ephemeral=True)
         return
-    try:
-        if operation.value == "add":
-            result = num1 + num2
-            symbol = "+"
-        elif operation.value == "subtract":
-            result = num1 - num2
-            symbol = "-"
-        elif operation.value == "multiply":
-            result = num1 * num2
-            symbol = "*"
-        elif operation.value == "divide":
-            result = num1 / num2
-            symbol = "/"
-        await interaction.response.send_message(f"🔢 `{num1} {symbol} {num2} = {result}`")
-    except Exception as e:
-        await interaction.response.send_message(f"⚠️ An error occurred: {str(e)}")
+    fn, symbol = _CALC_OPS[operation.value]
+    result = fn(num1, num2)
+    await interaction.response.send_message(f"🔢 `{num1} {symbol} {num2} = {result}`")
 
 # List All Commands
-@bot.tree.command(name="listallcommands", description="List all available slash commands, optionally filtered by category.")
-@app_commands.describe(category="Optional: Filter commands by category")
-@app_commands.choices(category=[
-    app_commands.Choice(name="AI Assistant", value="ai"),
-    app_commands.Choice(name="Currency Conversion", value="currency"),
-    app_commands.Choice(name="Utility Tools", value="utility"),
-    app_commands.Choice(name="Reminders & Polls", value="reminders_polls"),
-    app_commands.Choice(name="Fun Commands", value="fun"),
-    app_commands.Choice(name="Developer Tools", value="developer"),
-])
-async def listallcommands(interaction: discord.Interaction, category: app_commands.Choice[str] = None):
-    embed = discord.Embed(
-        title="📚 All Available Commands",
-        description="A categorized list of all commands for easy navigation.",
-        color=discord.Color.from_rgb(0, 0, 0)  # Black
-    )
-
-    commands_by_category = {
-        "ai": """
+# The command catalog is static, so the category texts and the full six-field
+# embed are built once at import; each call only copies the dict and stamps
+# the timestamp.
+_COMMANDS_BY_CATEGORY = {
+    "ai": """
 - `/ask <prompt>` - Chat with Llama 3 AI  
 - `/clearhistory` - Clear your AI conversation history
-        """,
-        "currency": """
+    """,
+    "currency": """
 - `/setrate <rates>` - Set custom Conversion Rates
 - `/resetrate <rates>` - Reset specific Conversion Rates back to Default
 - `/payout <robux>` - Convert Robux to PHP at Payout rate
@@ -1262,8 +1744,8 @@ async def listallcommands(interaction: discord.Interaction, category: app_comman
 - `/beforetax <robux>` - Calculate how much Robux you'll receive after 30% tax
 - `/aftertax <robux>` - Calculate how much Robux to send to receive desired amount after 30% tax
 - `/checkpayout <user_id>` - Check if a Roblox User is Eligible for Group Payout
-        """,
-        "utility": """
+    """,
+    "utility": """
 - `/userinfo [user]` - View detailed info about a user  
 - `/purge <amount>` - Delete messages (requires mod permissions)    
 - `/group` - Show info about the 1cy Roblox Group  
@@ -1272,12 +1754,12 @@ async def listallcommands(interaction: discord.Interaction, category: app_comman
 - `/gamepass <id>` - Show a public Roblox Gamepass Link using an ID or Creator Dashboard URL
 - `/avatar [user]` - Display a user's profile picture
 - `/banner [user]` - Display a user's bannner
-        """,
-        "reminders_polls": """
+    """,
+    "reminders_polls": """
 - `/remindme <minutes> <note>` - Set a personal reminder  
 - `/poll <question> <time> <unit>` - Create a timed poll  
-        """,
-        "fun": """
+    """,
+    "fun": """
 - `/donate <user> <amount>` - Donate Robux to someone
 - `/say <message>` - Make the bot say something
 - `/calculator <num1> <operation> <num2>` - Perform math operations
@@ -1285,40 +1767,63 @@ async def listallcommands(interaction: discord.Interaction, category: app_comman
 - `/tiktok <link>` - Convert a TikTok Link into a Video
 - `/instagram <link>` - Convert Instagram Link into a Media/Video
 - `/` - Show the last deleted message
-        """,
-        "developer": """
+    """,
+    "developer": """
 - `/dm <user> <message>` - Send a direct message to a specific user  
 - `/dmall <message>` - Send a direct message to all members in the server
 - `/invite` - Get the invite link for the bot  
 - `/status` - Show how many servers the bot is in and total user count
 - `/payment <method>` - Show payment instructions (Gcash/PayMaya/GoTyme)
-        """
-    }
+    """
+}
 
-    if category is None:
-        # No filter — show all categories
-        embed.add_field(name="🤖 AI Assistant", value=commands_by_category["ai"], inline=False)
-        embed.add_field(name="💰 Currency Conversion", value=commands_by_category["currency"], inline=False)
-        embed.add_field(name="🛠️ Utility Tools", value=commands_by_category["utility"], inline=False)
-        embed.add_field(name="⏰ Reminders & Polls", value=commands_by_category["reminders_polls"], inline=False)
-        embed.add_field(name="🎉 Fun", value=commands_by_category["fun"], inline=False)
-        embed.add_field(name="🔧 Developer Tools", value=commands_by_category["developer"], inline=False)
-    else:
-        # Show only selected category
-        category_key = category.value
-        category_name_map = {
-            "ai": "🤖 AI Assistant",
-            "currency": "💰 Currency Conversion",
-            "utility": "🛠️ Utility Tools",
-            "reminders_polls": "⏰ Reminders & Polls",
-            "fun": "🎉 Fun",
-            "developer": "🔧 Developer Tools"
-        }
-        full_category_name = category_name_map.get(category_key, "Unknown Category")
-        field_value = commands_by_category.get(category_key, "No commands found for this category.")
-        embed.add_field(name=full_category_name, value=field_value, inline=False)
+_CATEGORY_NAMES = {
+    "ai": "🤖 AI Assistant",
+    "currency": "💰 Currency Conversion",
+    "utility": "🛠️ Utility Tools",
+    "reminders_polls": "⏰ Reminders & Polls",
+    "fun": "🎉 Fun",
+    "developer": "🔧 Developer Tools"
+}
 
+def _build_listcmds_embed():
+    embed = discord.Embed(
+        title="📚 All Available Commands",
+        description="A categorized list of all commands for easy navigation.",
+        color=discord.Color.from_rgb(0, 0, 0)  # Black
+    )
+    for key, name in _CATEGORY_NAMES.items():
+        embed.add_field(name=name, value=_COMMANDS_BY_CATEGORY[key], inline=False)
     embed.set_footer(text="Neroniel")
+    return embed.to_dict()
+
+_LISTCMDS_EMBED_DICT = _build_listcmds_embed()
+
+@bot.tree.command(name="listallcommands", description="List all available slash commands, optionally filtered by category.")
+@app_commands.describe(category="Optional: Filter commands by category")
+@app_commands.choices(category=[
+    app_commands.Choice(name="AI Assistant", value="ai"),
+    app_commands.Choice(name="Currency Conversion", value="currency"),
+    app_commands.Choice(name="Utility Tools", value="utility"),
+    app_commands.Choice(name="Reminders & Polls", value="reminders_polls"),
+    app_commands.Choice(name="Fun Commands", value="fun"),
+    app_commands.Choice(name="Developer Tools", value="developer"),
+])
+async def listallcommands(interaction: discord.Interaction, category: app_commands.Choice[str] = None):
+    if category is None:
+        embed = discord.Embed.from_dict(_LISTCMDS_EMBED_DICT)
+    else:
+        embed = discord.Embed(
+            title="📚 All Available Commands",
+            description="A categorized list of all commands for easy navigation.",
+            color=discord.Color.from_rgb(0, 0, 0)  # Black
+        )
+        embed.add_field(
+            name=_CATEGORY_NAMES.get(category.value, "Unknown Category"),
+            value=_COMMANDS_BY_CATEGORY.get(category.value, "No commands found for this category."),
+            inline=False
+        )
+        embed.set_footer(text="Neroniel")
     embed.timestamp = datetime.now(PH_TIMEZONE)
     await interaction.response.send_message(embed=embed)
 
@@ -1330,46 +1835,50 @@ class PaymentMethod(str, Enum):
     GCASH = "Gcash"
     PAYMAYA = "PayMaya"
     GOTYME = "GoTyme"
-@bot.tree.command(name="payment", description="Show payment instructions for Gcash, PayMaya, or GoTyme")
-@app_commands.describe(method="Choose a payment method to display instructions")
-@app_commands.choices(method=[
-    app_commands.Choice(name=PaymentMethod.GCASH, value=PaymentMethod.GCASH),
-    app_commands.Choice(name=PaymentMethod.PAYMAYA, value=PaymentMethod.PAYMAYA),
-    app_commands.Choice(name=PaymentMethod.GOTYME, value=PaymentMethod.GOTYME),
-])
-async def payment(interaction: discord.Interaction, method: PaymentMethod):
-    payment_info = {
-        PaymentMethod.GCASH: {
-            "title": "Gcash Payment",
-            "description": "Account Initials: M R G.\nAccount Number: `09550333612`",
-            "image": "https://raw.githubusercontent.com/KxroAI/whatupmyniggga/c52d0cb1f626fd55d24a6181fd3821c9dd9f1455/IMG_2868.jpeg"
-        },
-        PaymentMethod.PAYMAYA: {
-            "title": "PayMaya Payment",
-            "description": "Account Initials: N G.\nAccount Number: `09550333612`",
-            "image": "https://raw.githubusercontent.com/KxroAI/whatupmyniggga/refs/heads/main/IMG_2869.jpeg"
-        },
-        PaymentMethod.GOTYME: {
-            "title": "GoTyme Payment",
-            "description": "Account Initials: N G.\nAccount Number: HIDDEN",
-            "image": "https://raw.githubusercontent.com/KxroAI/whatupmyniggga/refs/heads/main/IMG_2870.jpeg"
-        }
-    }
 
-    info = payment_info[method]
+PAYMENT_INFO = {
+    PaymentMethod.GCASH: {
+        "title": "Gcash Payment",
+        "description": "Account Initials: M R G.\nAccount Number: `09550333612`",
+        "image": "https://raw.githubusercontent.com/KxroAI/whatupmyniggga/c52d0cb1f626fd55d24a6181fd3821c9dd9f1455/IMG_2868.jpeg"
+    },
+    PaymentMethod.PAYMAYA: {
+        "title": "PayMaya Payment",
+        "description": "Account Initials: N G.\nAccount Number: `09550333612`",
+        "image": "https://raw.githubusercontent.com/KxroAI/whatupmyniggga/refs/heads/main/IMG_2869.jpeg"
+    },
+    PaymentMethod.GOTYME: {
+        "title": "GoTyme Payment",
+        "description": "Account Initials: N G.\nAccount Number: HIDDEN",
+        "image": "https://raw.githubusercontent.com/KxroAI/whatupmyniggga/refs/heads/main/IMG_2870.jpeg"
+    }
+}
 
+def _build_payment_embed(info):
     embed = discord.Embed(
         title=info["title"],
         description=info["description"],
         color=discord.Color.from_rgb(0, 0, 0)
     )
-
     if info["image"]:
         embed.set_image(url=info["image"])
-
     embed.set_footer(text="Neroniel")
-    embed.timestamp = datetime.now(PH_TIMEZONE)
+    return embed
 
+# The instructions are static, so the three embeds are built once; each call
+# copies one and stamps the timestamp.
+PAYMENT_EMBEDS = {method: _build_payment_embed(info) for method, info in PAYMENT_INFO.items()}
+
+@bot.tree.command(name="payment", description="Show payment instructions for Gcash, PayMaya, or GoTyme")
+@app_commands.describe(method="Choose a payment method to display instructions")
+@app_commands.choices(method=[
+    app_commands.Choice(name=PaymentMethod.GCASH, value=PaymentMethod.GCASH),
+    app_commands.Choice(name=PaymentMethod.PAYMAYA, value=PaymentMethod.PAYMAYA),
+    app_commands.Choice(name=PaymentMethod.GOTYME, value=PaymentMethod.GOTYME),
+])
+async def payment(interaction: discord.Interaction, method: PaymentMethod):
+    embed = PAYMENT_EMBEDS[method].copy()
+    embed.timestamp = datetime.now(PH_TIMEZONE)
     await interaction.response.send_message(embed=embed)
 
 # ========== Avatar Command ==========
@@ -1430,23 +1939,44 @@ async def banner(interaction: discord.Interaction, user: discord.User = None):
     await interaction.response.send_message(embed=embed)
 
 # ========== Invite Command ==========
+_INVITE_EMBED = discord.Embed(
+    title="🔗 Invite N Bot",
+    description="Click [here](https://discord.com/oauth2/authorize?client_id=1358242947790803084&permissions=8&integration_type=0&scope=bot%20applications.commands) to invite the bot to your server!",
+    color=discord.Color.from_rgb(0, 0, 0)  # Black using RGB
+)
+_INVITE_EMBED.set_footer(text="Neroniel")
+
 @bot.tree.command(name="invite", description="Get the invite link for the bot")
 async def invite(interaction: discord.Interaction):
-    embed = discord.Embed(
-        title="🔗 Invite N Bot",
-        description="Click [here](https://discord.com/oauth2/authorize?client_id=1358242947790803084&permissions=8&integration_type=0&scope=bot%20applications.commands ) to invite the bot to your server!",
-        color=discord.Color.from_rgb(0, 0, 0)  # Black using RGB
-    )
-    embed.set_footer(text="Neroniel")
+    embed = _INVITE_EMBED.copy()
     embed.timestamp = datetime.now(PH_TIMEZONE)
     await interaction.response.send_message(embed=embed)
 
 # ========== Status Command ==========
+# Running totals maintained by the guild/member events below so /status is an
+# attribute read instead of an O(guilds) sweep per call.
+bot._total_users = 0
+
+@bot.event
+async def on_guild_join(guild):
+    bot._total_users += guild.member_count or 0
+
+@bot.event
+async def on_guild_remove(guild):
+    bot._total_users -= guild.member_count or 0
+
+@bot.event
+async def on_member_join(member):
+    bot._total_users += 1
+
+@bot.event
+async def on_member_remove(member):
+    bot._total_users -= 1
+
 @bot.tree.command(name="status", description="Show how many servers the bot is in and total user count")
 async def status(interaction: discord.Interaction):
-    guilds = interaction.client.guilds
-    total_servers = len(guilds)
-    total_users = sum(guild.member_count for guild in guilds)
+    total_servers = len(interaction.client.guilds)
+    total_users = bot._total_users
 
     description = f"**Total Servers:** {total_servers}\n"
     description += f"**Total Users:** {total_users}\n"
@@ -1495,40 +2025,40 @@ async def stocks(interaction: discord.Interaction):
         }
     }
 
-    async with aiohttp.ClientSession() as session:
-        # Fetch Group Funds
-        try:
-            group_url = f"https://economy.roblox.com/v1/groups/{GROUP_ID}/currency"
-            headers["Cookie"] = ROBLOX_COOKIE
-            async with session.get(group_url, headers=headers) as resp:
-                if resp.status == 200:
-                    response = await resp.json()
-                    data['group_funds'] = f"{response.get('robux', 0):,} R$"
-        except Exception as e:
-            print(f"[ERROR] Group Funds: {str(e)}")
+    session = bot.http_session
+    # Fetch Group Funds
+    try:
+        group_url = f"https://economy.roblox.com/v1/groups/{GROUP_ID}/currency"
+        headers["Cookie"] = ROBLOX_COOKIE
+        async with session.get(group_url, headers=headers) as resp:
+            if resp.status == 200:
+                response = await resp.json()
+                data['group_funds'] = f"{response.get('robux', 0):,} R$"
+    except Exception as e:
+        print(f"[ERROR] Group Funds: {str(e)}")
 
-        # Fetch Account Balance
-        try:
-            account_url = f"https://economy.roblox.com/v1/users/{roblox_user_id}/currency"
-            headers["Cookie"] = ROBLOX_STOCKS
-            async with session.get(account_url, headers=headers) as resp:
-                if resp.status == 200:
-                    response = await resp.json()
-                    data['account_balance'] = f"{response.get('robux', 0):,} R$"
-        except Exception as e:
-            print(f"[ERROR] Account Balance: {str(e)}")
+    # Fetch Account Balance
+    try:
+        account_url = f"https://economy.roblox.com/v1/users/{roblox_user_id}/currency"
+        headers["Cookie"] = ROBLOX_STOCKS
+        async with session.get(account_url, headers=headers) as resp:
+            if resp.status == 200:
+                response = await resp.json()
+                data['account_balance'] = f"{response.get('robux', 0):,} R$"
+    except Exception as e:
+        print(f"[ERROR] Account Balance: {str(e)}")
 
-        # Fetch Revenue Summary
-        try:
-            revenue_url = f"https://economy.roblox.com/v1/groups/{GROUP_ID}/revenue/summary/daily"
-            headers["Cookie"] = ROBLOX_COOKIE
-            async with session.get(revenue_url, headers=headers) as resp:
-                if resp.status == 200:
-                    response = await resp.json()
-                    data['revenue']['pending_robux'] = f"{response.get('pendingRobux', 0):,} R$"
-                    data['revenue']['completed_robux'] = f"{response.get('itemSaleRobux', 0):,} R$"
-        except Exception as e:
-            print(f"[ERROR] Revenue Summary: {str(e)}")
+    # Fetch Revenue Summary
+    try:
+        revenue_url = f"https://economy.roblox.com/v1/groups/{GROUP_ID}/revenue/summary/daily"
+        headers["Cookie"] = ROBLOX_COOKIE
+        async with session.get(revenue_url, headers=headers) as resp:
+            if resp.status == 200:
+                response = await resp.json()
+                data['revenue']['pending_robux'] = f"{response.get('pendingRobux', 0):,} R$"
+                data['revenue']['completed_robux'] = f"{response.get('itemSaleRobux', 0):,} R$"
+    except Exception as e:
+        print(f"[ERROR] Revenue Summary: {str(e)}")
 
     # Build Embed
     embed = discord.Embed(
@@ -1716,27 +2246,27 @@ async def check_payout(interaction: discord.Interaction, username: str):
 
     # Step 1: Resolve username to user_id and display_name
     try:
-        async with aiohttp.ClientSession() as session:
-            url = 'https://users.roblox.com/v1/usernames/users'
-            headers = {'Content-Type': 'application/json'}
-            data = {'usernames': [username], 'excludeBannedUsers': True}
+        session = bot.http_session
+        url = 'https://users.roblox.com/v1/usernames/users'
+        headers = {'Content-Type': 'application/json'}
+        data = {'usernames': [username], 'excludeBannedUsers': True}
 
-            async with session.post(url, headers=headers, json=data) as resp:
-                if resp.status == 200:
-                    json_data = await resp.json()
-                    if json_data['data']:
-                        user_id = json_data['data'][0]['id']
-                        display_name = json_data['data'][0]['displayName']
-                    else:
-                        embed.description = "❌ User not found with that username."
-                        embed.color = discord.Color.red()
-                        await interaction.followup.send(embed=embed)
-                        return
+        async with session.post(url, headers=headers, json=data) as resp:
+            if resp.status == 200:
+                json_data = await resp.json()
+                if json_data['data']:
+                    user_id = json_data['data'][0]['id']
+                    display_name = json_data['data'][0]['displayName']
                 else:
-                    embed.description = f"❌ Error resolving username. Status code: {resp.status}"
+                    embed.description = "❌ User not found with that username."
                     embed.color = discord.Color.red()
                     await interaction.followup.send(embed=embed)
                     return
+            else:
+                embed.description = f"❌ Error resolving username. Status code: {resp.status}"
+                embed.color = discord.Color.red()
+                await interaction.followup.send(embed=embed)
+                return
     except Exception as e:
         embed.description = f"❌ An error occurred during username lookup: `{str(e)}`"
         embed.color = discord.Color.red()
@@ -1745,23 +2275,23 @@ async def check_payout(interaction: discord.Interaction, username: str):
 
     # Step 2: Check if user is in the group
     try:
-        async with aiohttp.ClientSession() as session:
-            membership_url = f'https://groups.roblox.com/v1/users/{user_id}/groups/roles'
-            async with session.get(membership_url) as membership_resp:
-                if membership_resp.status == 200:
-                    groups = await membership_resp.json()
-                    in_group = any(group['group']['id'] == int(GROUP_ID) for group in groups['data'])
-
-                    if not in_group:
-                        embed.description = f"`{username}` ({display_name}) is ❌ not a member of the Group."
-                        embed.color = discord.Color.red()
-                        await interaction.followup.send(embed=embed)
-                        return
-                else:
-                    embed.description = f"❌ Error checking Group Membership. Status code: {membership_resp.status}"
+        session = bot.http_session
+        membership_url = f'https://groups.roblox.com/v1/users/{user_id}/groups/roles'
+        async with session.get(membership_url) as membership_resp:
+            if membership_resp.status == 200:
+                groups = await membership_resp.json()
+                in_group = any(group['group']['id'] == int(GROUP_ID) for group in groups['data'])
+
+                if not in_group:
+                    embed.description = f"`{username}` ({display_name}) is ❌ not a member of the Group."
                     embed.color = discord.Color.red()
                     await interaction.followup.send(embed=embed)
                     return
+            else:
+                embed.description = f"❌ Error checking Group Membership. Status code: {membership_resp.status}"
+                embed.color = discord.Color.red()
+                await interaction.followup.send(embed=embed)
+                return
     except Exception as e:
         embed.description = f"❌ An error occurred during Group Membership check: `{str(e)}`"
         embed.color = discord.Color.red()
@@ -1770,53 +2300,53 @@ async def check_payout(interaction: discord.Interaction, username: str):
 
     # Step 3: Check payout eligibility
     try:
-        async with aiohttp.ClientSession() as session:
-            url = f'https://economy.roblox.com/v1/groups/{GROUP_ID}/users-payout-eligibility?userIds={user_id}'
-            headers = {
-                'Cookie': ROBLOX_COOKIE,
-                'Accept': 'application/json',
-                'Content-Type': 'application/json'
-            }
-
-            async with session.get(url, headers=headers) as response:
-                text = await response.text()
-
-                if response.status == 200:
-                    try:
-                        data = json.loads(text)  # Using json.loads for more reliable parsing
-                        # Debugging: Print the raw response to see what we're getting
-                        print(f"Raw response data: {data}")
-
-                        # Check the correct structure for payout eligibility
-                        if "usersGroupPayoutEligibility" in data:
-                            eligibility_data = data["usersGroupPayoutEligibility"]
-                            eligibility_status = eligibility_data.get(str(user_id))
-
-                            if eligibility_status is None:
-                                embed.description = f"`{username}` ({display_name}) was not found in the Payout Eligibility list."
-                                embed.color = discord.Color.orange()
-                            else:
-                                # Check if the value is boolean or a string representation
-                                if isinstance(eligibility_status, bool):
-                                    status_text = "✅ Eligible" if eligibility_status else "❌ Not Currently Eligible"
-                                else:
-                                    # Handle string values
-                                    status_text = "✅ Eligible" if str(eligibility_status).lower() in ['true', 'eligible'] else "❌ Not Currently Eligible"
-
-                                embed.description = f"`{username}` ({display_name}) is **{status_text}**"
-                                embed.color = discord.Color.green() if "✅" in status_text else discord.Color.red()
+        session = bot.http_session
+        url = f'https://economy.roblox.com/v1/groups/{GROUP_ID}/users-payout-eligibility?userIds={user_id}'
+        headers = {
+            'Cookie': ROBLOX_COOKIE,
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
+
+        async with session.get(url, headers=headers) as response:
+            text = await response.text()
+
+            if response.status == 200:
+                try:
+                    data = json.loads(text)  # Using json.loads for more reliable parsing
+                    # Debugging: Print the raw response to see what we're getting
+                    print(f"Raw response data: {data}")
+
+                    # Check the correct structure for payout eligibility
+                    if "usersGroupPayoutEligibility" in data:
+                        eligibility_data = data["usersGroupPayoutEligibility"]
+                        eligibility_status = eligibility_data.get(str(user_id))
+
+                        if eligibility_status is None:
+                            embed.description = f"`{username}` ({display_name}) was not found in the Payout Eligibility list."
+                            embed.color = discord.Color.orange()
                         else:
-                            embed.description = "❌ Invalid response format from Roblox API."
-                            embed.color = discord.Color.red()
-                    except json.JSONDecodeError:
-                        embed.description = f"❌ Error parsing JSON response: {text}"
-                        embed.color = discord.Color.red()
-                    except Exception as e:
-                        embed.description = f"❌ Error processing response: {str(e)}"
+                            # Check if the value is boolean or a string representation
+                            if isinstance(eligibility_status, bool):
+                                status_text = "✅ Eligible" if eligibility_status else "❌ Not Currently Eligible"
+                            else:
+                                # Handle string values
+                                status_text = "✅ Eligible" if str(eligibility_status).lower() in ['true', 'eligible'] else "❌ Not Currently Eligible"
+
+                            embed.description = f"`{username}` ({display_name}) is **{status_text}**"
+                            embed.color = discord.Color.green() if "✅" in status_text else discord.Color.red()
+                    else:
+                        embed.description = "❌ Invalid response format from Roblox API."
                         embed.color = discord.Color.red()
-                else:
-                    embed.description = f"❌ API Error: Status {response.status}\nResponse: {text}"
+                except json.JSONDecodeError:
+                    embed.description = f"❌ Error parsing JSON response: {text}"
                     embed.color = discord.Color.red()
+                except Exception as e:
+                    embed.description = f"❌ Error processing response: {str(e)}"
+                    embed.color = discord.Color.red()
+            else:
+                embed.description = f"❌ API Error: Status {response.status}\nResponse: {text}"
+                embed.color = discord.Color.red()
 
     except Exception as e:
         embed.description = f"❌ An error occurred during payout check: `{str(e)}`"
@@ -1840,117 +2370,118 @@ async def get_cookie_from_login(username, password, interaction, captcha_data=No
         "password": password
     }
     headers = {}
-    async with aiohttp.ClientSession() as session:
-        bot.xcsrf_token = await get_csrf_token(session)
-        if bot.xcsrf_token:
-            headers["x-csrf-token"] = bot.xcsrf_token
-
-        if captcha_data:
-            payload.update({
-                "captchaToken": captcha_data["token"],
-                "captchaId": captcha_data["id"]
-            })
-
-        async with session.post(url, json=payload, headers=headers) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                cookie = None
-                set_cookies = resp.headers.getall("Set-Cookie")
-                for c in set_cookies:
-                    if ".ROBLOSECURITY" in c:
-                        cookie = c.split(".ROBLOSECURITY=")[1].split(";")[0]
-                return {"cookie": cookie, "xcsrf": resp.headers.get("x-csrf-token")}
-            elif resp.status == 403:
-                data = await resp.json()
-                error = data.get("errors", [{}])[0]
-                if error.get("code") == 2:
-                    field_data = json.loads(error.get("fieldData", "{}"))
-                    captcha_id = field_data.get("unifiedCaptchaId")
-                    return {"captcha": True, "captcha_id": captcha_id}
-                else:
-                    raise Exception(f"Login failed: {error}")
+    session = bot.http_session
+    bot.xcsrf_token = await get_csrf_token(session)
+    if bot.xcsrf_token:
+        headers["x-csrf-token"] = bot.xcsrf_token
+
+    if captcha_data:
+        payload.update({
+            "captchaToken": captcha_data["token"],
+            "captchaId": captcha_data["id"]
+        })
+
+    async with session.post(url, json=payload, headers=headers) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            cookie = None
+            set_cookies = resp.headers.getall("Set-Cookie")
+            for c in set_cookies:
+                if ".ROBLOSECURITY" in c:
+                    cookie = c.split(".ROBLOSECURITY=")[1].split(";")[0]
+            return {"cookie": cookie, "xcsrf": resp.headers.get("x-csrf-token")}
+        elif resp.status == 403:
+            data = await resp.json()
+            error = data.get("errors", [{}])[0]
+            if error.get("code") == 2:
+                field_data = json.loads(error.get("fieldData", "{}"))
+                captcha_id = field_data.get("unifiedCaptchaId")
+                return {"captcha": True, "captcha_id": captcha_id}
             else:
-                text = await resp.text()
-                raise Exception(f"Unexpected response: {resp.status} - {text}")
+                raise Exception(f"Login failed: {error}")
+        else:
+            text = await resp.text()
+            raise Exception(f"Unexpected response: {resp.status} - {text}")
 
 
 async def fetch_roblox_info(cookie):
-    async with aiohttp.ClientSession(headers={"Cookie": f".ROBLOSECURITY={cookie}"}) as session:
-        # Step 1: Get authenticated user ID
-        async with session.get("https://users.roblox.com/v1/users/authenticated")  as r:
-            if r.status != 200:
-                raise Exception("Invalid or expired .ROBLOSECURITY cookie.")
-            auth_data = await r.json()
-            user_id = auth_data["id"]
-
-        # Step 2: Get user info
-        async with session.get(f"https://users.roblox.com/v1/users/{user_id}")  as r:
-            user_data = await r.json()
-            username = user_data["name"]
-            display_name = user_data.get("displayName", username)
-            description = user_data.get("description", "None")
-
-        # Step 3: Robux Balance
-        async with session.get(f"https://economy.roblox.com/v1/users/{user_id}/currency")  as r:
-            economy_data = await r.json()
-            robux = economy_data.get("robux", 0)
-
-        # Step 4: Premium Status
-        async with session.get(f"https://premiumfeatures.roblox.com/v1/users/{user_id}/validate-membership")  as r:
-            premium = await r.json()
-
-        # Step 5: Credit Balance
-        async with session.get("https://billing.roblox.com/v1/credit")  as r:
-            credit_info = await r.json()
-            credit = credit_info.get("balance", 0)
-
-        # Step 6: Email Verified?
-        async with session.get("https://accountinformation.roblox.com/v1/email")  as r:
-            email_info = await r.json()
-            email_verified = email_info.get("verified", False)
-
-        # Step 7: Phone Verified?
-        async with session.get("https://accountsettings.roblox.com/v1/privacy")  as r:
-            phone_info = await r.json()
-            phone_verified = phone_info.get("phoneDiscovery", "") == "AllUsers"
-
-        # Step 8: Can View Inventory
-        async with session.get(f"https://inventory.roblox.com/v1/users/{user_id}/can-view-inventory")  as r:
-            inv_info = await r.json()
-            inv_public = inv_info.get("canView", False)
-
-        # Step 9: Primary Group
-        async with session.get(f"https://groups.roblox.com/v1/users/{user_id}/groups/primary/role")  as r:
-            group_info = await r.json()
-            group = group_info.get("group", None)
-
-        # Step 10: Total RAP
-        rap = await get_total_rap(user_id, session)
+    headers = {"Cookie": f".ROBLOSECURITY={cookie}"}
+    session = bot.http_session
+    # Step 1: Get authenticated user ID
+    async with session.get("https://users.roblox.com/v1/users/authenticated", headers=headers)  as r:
+        if r.status != 200:
+            raise Exception("Invalid or expired .ROBLOSECURITY cookie.")
+        auth_data = await r.json()
+        user_id = auth_data["id"]
+
+    # Step 2: Get user info
+    async with session.get(f"https://users.roblox.com/v1/users/{user_id}", headers=headers)  as r:
+        user_data = await r.json()
+        username = user_data["name"]
+        display_name = user_data.get("displayName", username)
+        description = user_data.get("description", "None")
+
+    # Step 3: Robux Balance
+    async with session.get(f"https://economy.roblox.com/v1/users/{user_id}/currency", headers=headers)  as r:
+        economy_data = await r.json()
+        robux = economy_data.get("robux", 0)
+
+    # Step 4: Premium Status
+    async with session.get(f"https://premiumfeatures.roblox.com/v1/users/{user_id}/validate-membership", headers=headers)  as r:
+        premium = await r.json()
+
+    # Step 5: Credit Balance
+    async with session.get("https://billing.roblox.com/v1/credit", headers=headers)  as r:
+        credit_info = await r.json()
+        credit = credit_info.get("balance", 0)
+
+    # Step 6: Email Verified?
+    async with session.get("https://accountinformation.roblox.com/v1/email", headers=headers)  as r:
+        email_info = await r.json()
+        email_verified = email_info.get("verified", False)
+
+    # Step 7: Phone Verified?
+    async with session.get("https://accountsettings.roblox.com/v1/privacy", headers=headers)  as r:
+        phone_info = await r.json()
+        phone_verified = phone_info.get("phoneDiscovery", "") == "AllUsers"
+
+    # Step 8: Can View Inventory
+    async with session.get(f"https://inventory.roblox.com/v1/users/{user_id}/can-view-inventory", headers=headers)  as r:
+        inv_info = await r.json()
+        inv_public = inv_info.get("canView", False)
+
+    # Step 9: Primary Group
+    async with session.get(f"https://groups.roblox.com/v1/users/{user_id}/groups/primary/role", headers=headers)  as r:
+        group_info = await r.json()
+        group = group_info.get("group", None)
+
+    # Step 10: Total RAP
+    rap = await get_total_rap(user_id, session, headers)
 
-        return {
-            "username": username,
-            "userid": user_id,
-            "display_name": display_name,
-            "description": description,
-            "robux": robux,
-            "premium": premium,
-            "credit": credit,
-            "email_verified": email_verified,
-            "phone_verified": phone_verified,
-            "inv_public": inv_public,
-            "group": group,
-            "rap": rap
-        }
+    return {
+        "username": username,
+        "userid": user_id,
+        "display_name": display_name,
+        "description": description,
+        "robux": robux,
+        "premium": premium,
+        "credit": credit,
+        "email_verified": email_verified,
+        "phone_verified": phone_verified,
+        "inv_public": inv_public,
+        "group": group,
+        "rap": rap
+    }
 
 
-async def get_total_rap(user_id, session):
+async def get_total_rap(user_id, session, headers=None):
     total_rap = 0
     cursor = ""
     while True:
         url = f"https://inventory.roblox.com/v1/users/{user_id}/assets/collectibles?sortOrder=Asc&limit=100"
         if cursor:
             url += f"&cursor={cursor}"
-        async with session.get(url) as r:
+        async with session.get(url, headers=headers) as r:
             data = await r.json()
             for item in data.get("data", []):
                 total_rap += item.get("recentAveragePrice", 0)
@@ -1983,9 +2514,9 @@ async def check(interaction: Interaction, cookie: str = None, username: str = No
             auth_result = {"cookie": cookie}
         else:
             bot.xcsrf_token = None
-            async with aiohttp.ClientSession() as session:
-                async with session.get("https://auth.roblox.com/v2/logout")  as r:
-                    bot.xcsrf_token = r.headers.get("x-csrf-token")
+            session = bot.http_session
+            async with session.get("https://auth.roblox.com/v2/logout")  as r:
+                bot.xcsrf_token = r.headers.get("x-csrf-token")
             auth_result = await get_cookie_from_login(username, password, interaction)
             if auth_result.get("captcha"):
                 captcha_url = "https://arkoselabs.com/demo" 
@@ -2111,44 +2642,46 @@ async def roblox(interaction: discord.Interaction, user: str):
     GROUP_ID = 5838002  # Your real group ID
 
     try:
-        async with aiohttp.ClientSession() as session:
-            user_id = None
-            display_name = None
-            full_data = None
-            last_online = "N/A"
-            status = "Offline"
-
-            # Resolve username or ID
-            if user.isdigit():
-                user_id = int(user)
-                async with session.get(f"https://users.roblox.com/v1/users/{user_id}") as resp:
-                    if resp.status != 200:
-                        return await interaction.followup.send("❌ User not found.", ephemeral=True)
-                    full_data = await resp.json()
-                    user = full_data['name']
-                    display_name = full_data['displayName']
-            else:
-                resolve_url = "https://users.roblox.com/v1/usernames/users"
-                payload = {"usernames": [user]}
-                headers = {"Content-Type": "application/json"}
-                async with session.post(resolve_url, json=payload, headers=headers) as resp:
-                    if resp.status != 200:
-                        return await interaction.followup.send("❌ Could not find that Roblox user.", ephemeral=True)
-                    data = await resp.json()
-                    if not data['data']:
-                        return await interaction.followup.send("❌ User not found.", ephemeral=True)
-                    user_data = data['data'][0]
-                    user_id = user_data['id']
-                    display_name = user_data['displayName']
-
-                async with session.get(f"https://users.roblox.com/v1/users/{user_id}") as resp:
-                    if resp.status != 200:
-                        return await interaction.followup.send("❌ Failed to fetch user details.", ephemeral=True)
-                    full_data = await resp.json()
-
-            # Presence
-            presence_url = "https://presence.roblox.com/v1/presence/users"
-            async with session.post(presence_url, json={"userIds": [user_id]}) as resp:
+        session = bot.http_session
+        user_id = None
+        display_name = None
+        full_data = None
+        last_online = "N/A"
+        status = "Offline"
+
+        # Resolve username or ID
+        if user.isdigit():
+            user_id = int(user)
+            async with session.get(f"https://users.roblox.com/v1/users/{user_id}") as resp:
+                if resp.status != 200:
+                    return await interaction.followup.send("❌ User not found.", ephemeral=True)
+                full_data = await resp.json()
+                user = full_data['name']
+                display_name = full_data['displayName']
+        else:
+            resolve_url = "https://users.roblox.com/v1/usernames/users"
+            payload = {"usernames": [user]}
+            headers = {"Content-Type": "application/json"}
+            async with session.post(resolve_url, json=payload, headers=headers) as resp:
+                if resp.status != 200:
+                    return await interaction.followup.send("❌ Could not find that Roblox user.", ephemeral=True)
+                data = await resp.json()
+                if not data['data']:
+                    return await interaction.followup.send("❌ User not found.", ephemeral=True)
+                user_data = data['data'][0]
+                user_id = user_data['id']
+                display_name = user_data['displayName']
+
+            async with session.get(f"https://users.roblox.com/v1/users/{user_id}") as resp:
+                if resp.status != 200:
+                    return await interaction.followup.send("❌ Failed to fetch user details.", ephemeral=True)
+                full_data = await resp.json()
+
+        # Everything below only needs user_id, so the presence, thumbnail,
+        # premium, connection-count and group-role lookups all run in parallel.
+        async def _presence():
+            status, last_online = "Offline", "N/A"
+            async with session.post("https://presence.roblox.com/v1/presence/users", json={"userIds": [user_id]}) as resp:
                 if resp.status == 200:
                     presence_data = await resp.json()
                     if presence_data.get("userPresences"):
@@ -2160,80 +2693,82 @@ async def roblox(interaction: discord.Interaction, user: str):
                         if last_online_raw:
                             last_dt = isoparse(last_online_raw)
                             last_online = last_dt.astimezone(PH_TIMEZONE).strftime("%A, %d %B %Y • %I:%M %p")
+            return status, last_online
 
-            # Thumbnail
+        async def _thumbnail():
             thumb_url = f"https://thumbnails.roblox.com/v1/users/avatar-headshot?userIds={user_id}&size=420x420&format=Png&scale=1"
             async with session.get(thumb_url) as resp:
                 if resp.status == 200:
                     thumb_data = await resp.json()
-                    image_url = thumb_data['data'][0]['imageUrl']
-                else:
-                    image_url = "https://www.roblox.com/asset-thumbnail/image?assetId=1&type=HeadShot&width=420&height=420&format=Png"
-
-            # Creation date
-            created_at = isoparse(full_data['created'])
-            created_str = created_at.astimezone(PH_TIMEZONE).strftime("%A, %d %B %Y • %I:%M %p")
+                    return thumb_data['data'][0]['imageUrl']
+            return "https://www.roblox.com/asset-thumbnail/image?assetId=1&type=HeadShot&width=420&height=420&format=Png"
 
-            # Description
-            description = full_data.get("description", "N/A") or "N/A"
-
-            # Emojis
-            verified = full_data.get('hasVerifiedBadge', False)
-            premium = False
+        async def _premium():
             try:
                 async with session.get(
                     f"https://premiumfeatures.roblox.com/v1/users/{user_id}/validate-membership",
                     headers={"Cookie": os.getenv("ROBLOX_COOKIE")}
                 ) as resp:
                     if resp.status == 200:
-                        premium = await resp.json()
-            except:
+                        return await resp.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
                 pass
+            return False
+
+        async def _count(kind):
+            async with session.get(f"https://friends.roblox.com/v1/users/{user_id}/{kind}/count") as r:
+                if r.status == 200:
+                    return (await r.json()).get('count', 0)
+            return 0
 
-            emoji = ""
-            if verified:
-                emoji += "<:RobloxVerified:1400310297184702564>"
-            if premium:
-                emoji += "<:RobloxPremium:1400310411550654495>"
-
-            # Connections
-            async with session.get(f"https://friends.roblox.com/v1/users/{user_id}/friends/count") as r1, \
-                       session.get(f"https://friends.roblox.com/v1/users/{user_id}/followers/count") as r2, \
-                       session.get(f"https://friends.roblox.com/v1/users/{user_id}/followings/count") as r3:
-                friends = (await r1.json()).get('count', 0) if r1.status == 200 else 0
-                followers = (await r2.json()).get('count', 0) if r2.status == 200 else 0
-                followings = (await r3.json()).get('count', 0) if r3.status == 200 else 0
-
-            # Group role check
-            role_name = None
+        async def _group_role():
             async with session.get(f"https://groups.roblox.com/v2/users/{user_id}/groups/roles") as resp:
                 if resp.status == 200:
                     groups_data = await resp.json()
                     for g in groups_data.get("data", []):
                         if g["group"]["id"] == GROUP_ID:
-                            role_name = g["role"]["name"]
-                            break
+                            return g["role"]["name"]
+            return None
 
-            # Embed (Status + Role on same block)
-            description_text = (
-                f"[**{display_name}**](https://www.roblox.com/users/{user_id}/profile) (**{user_id}**)\n"
-                f"**@{user}** {emoji}\n"
-                f"**Account Created:** {created_str}\n"
-                f"```{description}```\n"
-                f"**Connections:** {friends}/{followers}/{followings}\n"
-                f"**Status:** {status}"
-                + (f" ({last_online})" if status == "Offline" and last_online != "N/A" else "")
-            )
+        (status, last_online), image_url, premium, friends, followers, followings, role_name = await asyncio.gather(
+            _presence(), _thumbnail(), _premium(),
+            _count("friends"), _count("followers"), _count("followings"),
+            _group_role()
+        )
 
-            if role_name:
-                description_text += f"\n**Group Role:** {role_name}"
+        # Creation date
+        created_at = isoparse(full_data['created'])
+        created_str = created_at.astimezone(PH_TIMEZONE).strftime("%A, %d %B %Y • %I:%M %p")
+
+        # Description
+        description = full_data.get("description", "N/A") or "N/A"
+
+        emoji = ""
+        if full_data.get('hasVerifiedBadge', False):
+            emoji += "<:RobloxVerified:1400310297184702564>"
+        if premium:
+            emoji += "<:RobloxPremium:1400310411550654495>"
+
+        # Embed (Status + Role on same block)
+        description_text = (
+            f"[**{display_name}**](https://www.roblox.com/users/{user_id}/profile) (**{user_id}**)\n"
+            f"**@{user}** {emoji}\n"
+            f"**Account Created:** {created_str}\n"
+            f"```{description}```\n"
+            f"**Connections:** {friends}/{followers}/{followings}\n"
+            f"**Status:** {status}"
+            + (f" ({last_online})" if status == "Offline" and last_online != "N/A" else "")
+        )
 
-            embed = discord.Embed(description=description_text, color=discord.Color.from_str("#000001"))
-            embed.set_thumbnail(url=image_url)
-            embed.set_footer(text="Neroniel")
-            embed.timestamp = datetime.now(PH_TIMEZONE)
+        if role_name:
+            description_text += f"\n**Group Role:** {role_name}"
 
-            await interaction.followup.send(embed=embed)
+        embed = discord.Embed(description=description_text, color=discord.Color.from_str("#000001"))
+        embed.set_thumbnail(url=image_url)
+        embed.set_footer(text="Neroniel")
+        embed.timestamp = datetime.now(PH_TIMEZONE)
+
+        await interaction.followup.send(embed=embed)
 
     except Exception as e:
         await interaction.followup.send(f"❌ An error occurred: `{str(e)}`", ephemeral=True)
@@ -2246,57 +2781,53 @@ async def roblox(interaction: discord.Interaction, user: str):
 @bot.event
 async def on_ready():
     bot.xcsrf_token = None
+    bot._total_users = sum(guild.member_count or 0 for guild in bot.guilds)
     print(f"Bot is ready! Logged in as {bot.user}")
-    await bot.tree.sync()
-    print("All commands synced!")
     # Start background tasks after bot is ready
     if reminders_collection is not None:
         if not check_reminders.is_running():
             print("✅ Starting reminder checker...")
             check_reminders.start()
-    GROUP_ID = int(os.getenv("GROUP_ID"))
-    while True:
-        try:
-            response = requests.get(f"https://groups.roblox.com/v1/groups/{GROUP_ID}")   
-            data = response.json()
-            member_count = data['memberCount']
-            await bot.change_presence(status=discord.Status.dnd,
-                                   activity=discord.Activity(
-                                       type=discord.ActivityType.watching,
-                                       name=f"1cy | {member_count} Members"))
-        except Exception as e:
-            print(f"Error fetching group info: {str(e)}")
-            await bot.change_presence(status=discord.Status.dnd,
-                                   activity=discord.Activity(
-                                       type=discord.ActivityType.watching,
-                                       name="1cy"))
-        await asyncio.sleep(60)
+
+# on_message runs for every message in every guild, so the keyword replies
+# are one dict lookup and the react channels one frozenset probe.
+KEYWORD_REPLIES = {
+    "hobie": "mapanghe",
+    "neroniel": "masarap",
+    "hi": (
+        "hi tapos ano? magiging friends tayo? lagi tayong mag-uusap mula umaga hanggang madaling araw? tas magiging close tayo? sa sobrang close natin nahuhulog na tayo sa isa't isa, tapos ano? liligawan mo ko? sasagutin naman kita. paplanuhin natin yung pangarap natin sa isa't isa tapos ano? may makikita kang iba. magsasawa ka na, iiwan mo na ako. tapos magmamakaawa ako sayo kasi mahal kita pero ano? wala kang gagawin, hahayaan mo lang akong umiiyak while begging you to stay. kaya wag na lang. thanks nalang sa hi mo"),
+    "hello": "hello, baby",
+}
+# Messages longer than the longest trigger can't match, so on_message skips
+# the per-message lowercase allocation for them entirely.
+_KEYWORD_MAX_LEN = max(map(len, KEYWORD_REPLIES))
+
+AUTO_REACT_CHANNELS = frozenset({
+    1225294057371074760,
+    1107600826664501258,
+    1107591404877791242,
+    1368123462077513738
+})
+HEART_CHANNEL = 1107281584337461321
 
 @bot.event
 async def on_message(message):
     if message.author == bot.user:
         return
-    content = message.content.lower()
-    if content == "hobie":
-        await message.channel.send("mapanghe")
-    elif content == "neroniel":
-        await message.channel.send("masarap")
-    elif content == "hi":
-        reply = (
-            "hi tapos ano? magiging friends tayo? lagi tayong mag-uusap mula umaga hanggang madaling araw? tas magiging close tayo? sa sobrang close natin nahuhulog na tayo sa isa't isa, tapos ano? liligawan mo ko? sasagutin naman kita. paplanuhin natin yung pangarap natin sa isa't isa tapos ano? may makikita kang iba. magsasawa ka na, iiwan mo na ako. tapos magmamakaawa ako sayo kasi mahal kita pero ano? wala kang gagawin, hahayaan mo lang akong umiiyak while begging you to stay. kaya wag na lang. thanks nalang sa hi mo")
-        await message.channel.send(reply)
-    elif content == "hello":
-        await message.channel.send("hello, baby")
-    auto_react_channels = [
-        1225294057371074760,
-        1107600826664501258,
-        1107591404877791242,
-        1368123462077513738
-    ]
-    if message.channel.id in auto_react_channels:
+    # Reaction-only channels return early so the keyword lookup (and the
+    # content lowercasing it needs) never runs there.
+    channel_id = message.channel.id
+    if channel_id in AUTO_REACT_CHANNELS:
         await message.add_reaction("🎀")
-    if message.channel.id == 1107281584337461321:
+        return
+    if channel_id == HEART_CHANNEL:
         await message.add_reaction("<:1cy_heart:1258694384346468362>")
+        return
+    content = message.content
+    if len(content) <= _KEYWORD_MAX_LEN:
+        reply = KEYWORD_REPLIES.get(content.lower())
+        if reply is not None:
+            await message.channel.send(reply)
 
 # Run the bot
 bot.run(os.getenv('DISCORD_TOKEN'))